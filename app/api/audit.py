@@ -0,0 +1,53 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from app.core.principal import Principal
+from app.api.deps import get_uow, get_current_user
+from app.core.unit_of_work import UnitOfWork
+from app.schemas.AuditSchema import AuditEventPage, AuditMetricsSchema
+from app.services.AuditService import AuditService
+from app.services.Exceptions import PermissionDenied, InvalidCursor
+
+auditRouter = APIRouter(prefix="/audit", tags=["audit"])
+
+
+@auditRouter.get(
+    "/users/{user_id}",
+    response_model=AuditEventPage,
+    summary="Audit trail of a user (Admin only)",
+    description="""
+    Returns signup, verify, login, role change, profile update and delete events
+    of a user, newest first. Page with `next_cursor`.
+
+    Events are written asynchronously in batches, the newest ones can appear
+    with up to a flush interval of delay.
+    """,
+    status_code=status.HTTP_200_OK,
+)
+async def get_user_audit_events(
+        user_id: UUID,
+        limit: int = Query(default=50, ge=1, le=500),
+        cursor: str | None = None,
+        current_user: Principal = Depends(get_current_user),
+        uow: UnitOfWork = Depends(get_uow)
+):
+    service = AuditService(uow)
+    try:
+        return await service.get_user_events(user_id, current_user.role, limit=limit, cursor=cursor)
+    except PermissionDenied:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@auditRouter.get(
+    "/metrics",
+    response_model=AuditMetricsSchema,
+    summary="Audit writer metrics (Admin only)",
+    description="Queue depth, dropped events and flush statistics of the audit writer.",
+    status_code=status.HTTP_200_OK,
+)
+async def get_audit_metrics(current_user: Principal = Depends(get_current_user)):
+    try:
+        return AuditService.get_metrics(current_user.role)
+    except PermissionDenied:
+        raise HTTPException(status_code=403, detail="Forbidden")
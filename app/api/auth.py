@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException, Request, Response, Cookie, Depends
 from fastapi.responses import HTMLResponse
 from starlette.responses import JSONResponse
-from app.schemas.UserSchema import UserCreate, UserSignIn
+from app.schemas.UserSchema import UserCreate, UserSignIn, ResendVerification
 from app.services.Exceptions import (
     UserAlreadyExistError,
     UserNotFoundError,
@@ -11,7 +11,8 @@ from app.services.Exceptions import (
     UserNotVerifiedException
 )
 from app.services.AuthService import AuthService
-from app.api.deps import get_uow
+from app.api.deps import get_uow, get_current_user
+from app.core.principal import Principal
 from app.core.unit_of_work import UnitOfWork
 
 authRouter = APIRouter(prefix='/auth', tags=['auth'])
@@ -69,6 +70,26 @@ async def verification(request: Request, token: str, uof: UnitOfWork = Depends(g
     return HTMLResponse(content="<h1>Email successfully verified!</h1>", status_code=200)
 
 
+@authRouter.post(
+    '/resend-verification',
+    summary="Resend verification email",
+    description="""
+    Sends a new verification link to an unverified account.  
+    - Limited per address by a cooldown and a daily cap.  
+    - Always answers the same way, whether or not the address is registered.
+    """,
+    responses={
+        202: {"description": "Request accepted"}
+    }
+)
+async def resend_verification(body: ResendVerification, uow: UnitOfWork = Depends(get_uow)):
+    service = AuthService(uow)
+    service.resend_verification(body.email)
+    return JSONResponse(status_code=202, content={
+        "msg": "If the account exists and is not verified, a new verification email is on its way"
+    })
+
+
 @authRouter.post(
     '/login',
     summary="User login",
@@ -149,3 +170,45 @@ async def refresh(response: Response, refresh_token: str = Cookie(None), uow: Un
         max_age=60 * 15
     )
     return {"msg": "Access token successfully refreshed"}
+
+
+@authRouter.post(
+    '/logout',
+    summary="Logout",
+    description="""
+    Revokes the access and refresh tokens stored in cookies and clears the cookies.  
+    Revoked tokens are rejected by every worker until they expire.
+    """,
+    responses={
+        200: {"description": "Logged out"}
+    }
+)
+async def logout(response: Response, access_token: str = Cookie(None), refresh_token: str = Cookie(None),
+                 uow: UnitOfWork = Depends(get_uow)):
+    service = AuthService(uow)
+    await service.logout(access_token, refresh_token)
+    response.delete_cookie("access_token", httponly=True, secure=True, samesite="none")
+    response.delete_cookie("refresh_token", httponly=True, secure=True, samesite="none")
+    return {"msg": "Logged out"}
+
+
+@authRouter.post(
+    '/revoke-all',
+    summary="Logout from all devices",
+    description="""
+    Revokes every access and refresh token issued to the current user so far.  
+    - The user has to login again on every device.  
+    - Clears the token cookies of this client.
+    """,
+    responses={
+        200: {"description": "All tokens revoked"},
+        401: {"description": "Not authenticated"}
+    }
+)
+async def revoke_all(response: Response, current_user: Principal = Depends(get_current_user),
+                     uow: UnitOfWork = Depends(get_uow)):
+    service = AuthService(uow)
+    await service.revoke_all(current_user)
+    response.delete_cookie("access_token", httponly=True, secure=True, samesite="none")
+    response.delete_cookie("refresh_token", httponly=True, secure=True, samesite="none")
+    return {"msg": "All tokens revoked"}
@@ -0,0 +1,109 @@
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from app.core.principal import Principal
+from app.api.deps import get_current_user
+from app.core.activity import activity_buffer
+from app.core.load_shedding import limiter
+from app.core.revocation import revocations
+from app.db.profiler import profiler
+from app.db.User import UserRole
+from app.repositories.SignupWriter import signup_writer
+from app.utils import background
+
+debugRouter = APIRouter(prefix="/debug", tags=["debug"])
+
+
+def require_admin(current_user: Principal = Depends(get_current_user)) -> Principal:
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return current_user
+
+
+@debugRouter.get(
+    "/activity",
+    summary="Activity write-behind buffer metrics (Admin only)",
+    description="Recorded, merged and dropped login / last seen updates and flush statistics.",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)],
+)
+async def get_activity_metrics():
+    return activity_buffer.snapshot()
+
+
+@debugRouter.get(
+    "/queries",
+    summary="Top SQL statements (Admin only)",
+    description="""
+    Per statement fingerprint: executions, total / average / max time and rows returned,
+    collected by the query profiler since start (or last reset).
+    """,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)],
+)
+async def get_top_queries(
+        top: int = Query(default=20, ge=1, le=500),
+        sort: Literal["total_ms", "count", "max_ms", "avg_ms", "rows"] = "total_ms"
+):
+    return profiler.top(top, sort=sort)
+
+
+@debugRouter.get(
+    "/statement-cache",
+    summary="Statement cache hit rates (Admin only)",
+    description="""
+    SQLAlchemy compiled statement cache outcomes, counted by the query profiler since
+    start (or last reset). `prepared_best_effort`: asyncpg prepared statement cache hits,
+    read from driver internals; `null` on other drivers or when they are not available.
+    """,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)],
+)
+async def get_statement_cache_stats():
+    return profiler.cache_snapshot()
+
+
+@debugRouter.delete(
+    "/queries",
+    summary="Reset SQL statement statistics (Admin only)",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)],
+)
+async def reset_query_stats():
+    profiler.reset()
+    return {"msg": "Query statistics reset"}
+
+
+@debugRouter.get(
+    "/load",
+    summary="Concurrency limit and shed counters (Admin only)",
+    description="""
+    Current adaptive limit, in-flight and queued requests, admitted / shed per priority class,
+    and fire-and-forget background tasks (verification emails) still running.
+    """,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)],
+)
+async def get_load_metrics():
+    return {**limiter.snapshot(), "background_tasks": background.pending()}
+
+
+@debugRouter.get(
+    "/signups",
+    summary="Signup group commit metrics (Admin only)",
+    description="Submitted, created and conflicting signups, batches written and the largest batch seen.",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)],
+)
+async def get_signup_metrics():
+    return signup_writer.snapshot()
+
+
+@debugRouter.get(
+    "/revocations",
+    summary="Token revocation list size (Admin only)",
+    description="Revoked token ids and per-user cutoffs held in this worker, and whether the list is replicated.",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)],
+)
+async def get_revocation_metrics():
+    return revocations.snapshot()
@@ -19,3 +19,17 @@ async def get_current_user(
         return await service.get_current_user(access_token=token)
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
+
+
+async def get_current_user_profile(
+        request: Request,
+        uow: UnitOfWork = Depends(get_uow)
+):
+    token = request.cookies.get("access_token")
+    if not token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    service = AuthService(uow)
+    try:
+        return await service.get_current_user_profile(access_token=token)
+    except Exception:
+        raise HTTPException(status_code=401, detail="Invalid token")
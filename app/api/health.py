@@ -0,0 +1,46 @@
+from fastapi import APIRouter, status
+from starlette.responses import JSONResponse
+from app.core.health import health_monitor
+
+healthRouter = APIRouter(prefix="/health", tags=["health"])
+
+
+# ================================================================
+# 💓 /health/live — Liveness probe
+# ================================================================
+@healthRouter.get(
+    "/live",
+    summary="Liveness probe",
+    description="""
+    The process is up and its event loop answers.  
+    Never checks dependencies: a database outage must not get every pod restarted.
+    """,
+    status_code=status.HTTP_200_OK,
+)
+async def live():
+    return {"status": "alive"}
+
+
+# ================================================================
+# 🚦 /health/ready — Readiness probe
+# ================================================================
+@healthRouter.get(
+    "/ready",
+    summary="Readiness probe",
+    description="""
+    Whether this instance should receive traffic, from the last background probe:  
+    - **database**: `SELECT 1` through the pool, pool size / checked out / overflow.  
+    - **redis**: ping, when Redis is used by this instance.  
+    - **executor**: password hashing tasks waiting for a thread.  
+    - **event_loop**: how late the event loop runs scheduled work.  
+
+    No I/O per call. `503` while starting, when a check fails or the probes are stale.
+    """,
+    responses={
+        200: {"description": "Ready"},
+        503: {"description": "Not ready, see checks"}
+    }
+)
+async def ready():
+    is_ready, report = health_monitor.readiness()
+    return JSONResponse(status_code=200 if is_ready else 503, content=report)
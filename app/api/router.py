@@ -1,7 +1,13 @@
 from fastapi import APIRouter
 from app.api.auth import authRouter
 from app.api.users import userRouter
+from app.api.audit import auditRouter
+from app.api.debug import debugRouter
+from app.api.health import healthRouter
 
 main_router = APIRouter()
 main_router.include_router(userRouter)
 main_router.include_router(router=authRouter)
+main_router.include_router(router=auditRouter)
+main_router.include_router(router=debugRouter)
+main_router.include_router(router=healthRouter)
@@ -1,10 +1,18 @@
 from typing import List
-from app.services.Exceptions import PermissionDenied, UserNotFoundError
-from fastapi import APIRouter, Depends, HTTPException, status
+from app.services.Exceptions import PermissionDenied, UserNotFoundError, InvalidCursor
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from app.services.UserService import UserService
-from app.api.deps import get_uow, get_current_user
+from app.core.principal import Principal
+from app.api.deps import get_uow, get_current_user, get_current_user_profile
 from app.core.unit_of_work import UnitOfWork
-from app.schemas.UserSchema import UserReadSchema, UserUpdate
+from app.schemas.UserSchema import (
+    UserReadSchema,
+    UserUpdate,
+    UserSearchPage,
+    UserStatsSchema,
+    UserBatchLookup,
+    UserBatchResult
+)
 
 userRouter = APIRouter(tags=["Users"], prefix="")
 
@@ -23,7 +31,7 @@ userRouter = APIRouter(tags=["Users"], prefix="")
     """,
     status_code=status.HTTP_200_OK,
 )
-async def get_user_info(current_user: UserReadSchema = Depends(get_current_user)):
+async def get_user_info(current_user: UserReadSchema = Depends(get_current_user_profile)):
     """
     Get current authenticated user's info.
 
@@ -54,7 +62,7 @@ async def get_user_info(current_user: UserReadSchema = Depends(get_current_user)
     status_code=status.HTTP_200_OK,
 )
 async def get_all_users_list(
-        current_user: UserReadSchema = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_user),
         uow: UnitOfWork = Depends(get_uow)
 ):
     """
@@ -69,6 +77,125 @@ async def get_all_users_list(
         raise HTTPException(status_code=403, detail="Forbidden")
 
 
+# ================================================================
+# 🔎 /users/search — Search users by name, surname or email (admin only)
+# ================================================================
+@userRouter.get(
+    "/users/search",
+    response_model=UserSearchPage,
+    summary="Search users (Admin only)",
+    description="""
+    Finds users by **partial or misspelled** name, surname or email.
+
+    Results are ranked by trigram similarity and paged with an opaque `cursor`
+    (pass `next_cursor` from the previous page). Backed by `pg_trgm` GIN indexes,
+    latency target is p95 < 50 ms on 1M users (`python -m benchmarks.search_users`).
+    At least 3 characters: shorter queries yield no trigrams to use the index with.
+
+    Only accessible by **Admin**.
+    """,
+    status_code=status.HTTP_200_OK,
+)
+async def search_users(
+        q: str = Query(min_length=3, max_length=255),
+        limit: int = Query(default=20, ge=1, le=100),
+        cursor: str | None = None,
+        current_user: Principal = Depends(get_current_user),
+        uow: UnitOfWork = Depends(get_uow)
+):
+    """
+    Search users.
+
+    **Parameters:**
+    - `q`: part of name, surname or email
+    - `limit`: page size
+    - `cursor`: `next_cursor` of the previous page
+
+    **Permissions:** Admin only.
+    """
+    service = UserService(uow)
+    try:
+        return await service.search_users(q, current_user.role, limit=limit, cursor=cursor)
+    except PermissionDenied:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# ================================================================
+# 📊 /users/stats — User statistics for the dashboard (admin only)
+# ================================================================
+@userRouter.get(
+    "/users/stats",
+    response_model=UserStatsSchema,
+    summary="User statistics (Admin only)",
+    description="""
+    Returns totals by role, verified / unverified counts and signups per day.
+
+    Served from incrementally maintained counters, so the cost does not grow with
+    the number of users. Counters are reconciled periodically by a Celery task.
+
+    Only accessible by **Admin**.
+    """,
+    status_code=status.HTTP_200_OK,
+)
+async def get_user_stats(
+        days: int = Query(default=30, ge=1, le=366),
+        current_user: Principal = Depends(get_current_user),
+        uow: UnitOfWork = Depends(get_uow)
+):
+    """
+    Get user statistics.
+
+    **Parameters:**
+    - `days`: how many days of signups to return
+
+    **Permissions:** Admin only.
+    """
+    service = UserService(uow)
+    try:
+        return await service.get_stats(current_user.role, days=days)
+    except PermissionDenied:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+# ================================================================
+# 📦 /users/batch — Resolve many users at once (admin only)
+# ================================================================
+@userRouter.post(
+    "/users/batch",
+    response_model=UserBatchResult,
+    summary="Batch user lookup (Admin only)",
+    description="""
+    Resolves many user `UUID`s and / or emails in one round trip, instead of one
+    `GET /users/{user_id}` per user. Returns found profiles plus the ids and emails
+    that were not found.
+
+    Only accessible by **Admin**.
+    """,
+    status_code=status.HTTP_200_OK,
+)
+async def get_users_batch(
+        lookup: UserBatchLookup,
+        current_user: Principal = Depends(get_current_user),
+        uow: UnitOfWork = Depends(get_uow)
+):
+    """
+    Batch lookup.
+
+    **Body:**
+    - `ids`: user UUIDs
+    - `emails`: user emails
+
+    **Permissions:** Admin only.
+    """
+    service = UserService(uow)
+    try:
+        return await service.get_users_batch(lookup, current_user.role)
+    except PermissionDenied:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
 # ================================================================
 # 👤 /users/{user_id} — Get user by ID (admin only)
 # ================================================================
@@ -85,7 +212,7 @@ async def get_all_users_list(
 )
 async def get_user_by_id_route(
         user_id: str,
-        current_user: UserReadSchema = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_user),
         uow: UnitOfWork = Depends(get_uow)
 ):
     """
@@ -111,7 +238,11 @@ async def get_user_by_id_route(
     "/users/{user_id}",
     summary="Delete user (Admin only)",
     description="""
-    Permanently deletes a user by their `UUID`.
+    Deletes a user by their `UUID`.
+
+    - The user disappears at once and their tokens are revoked.  
+    - The row and its audit events are purged later by a background task.  
+    - The email can be registered again right away.
 
     Only accessible by users with the **Admin** role.
     """,
@@ -119,7 +250,7 @@ async def get_user_by_id_route(
 )
 async def delete_user(
         user_id: str,
-        current_user: UserReadSchema = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_user),
         uow: UnitOfWork = Depends(get_uow),
 ):
     """
@@ -132,7 +263,7 @@ async def delete_user(
     """
     service = UserService(uow)
     try:
-        return await service.delete_user_by_id(user_id, current_user.role)
+        return await service.delete_user_by_id(user_id, current_user.role, actor_id=current_user.id)
     except PermissionDenied:
         raise HTTPException(status_code=403, detail="Forbidden")
     except UserNotFoundError:
@@ -157,7 +288,7 @@ async def delete_user(
 async def update_user(
         user_id: str,
         user_update_data:UserUpdate,
-        current_user: UserReadSchema = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_user),
         uow: UnitOfWork = Depends(get_uow),
 ):
     """
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from datetime import datetime, UTC
+from typing import Dict, Optional
+from uuid import UUID
+from app.core.config import ACTIVITY_FLUSH_INTERVAL, ACTIVITY_MAX_PENDING_USERS
+from app.core.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityBuffer:
+    """Write-behind buffer for last_login_at / last_seen_at / login_count.
+    Updates are merged per user in memory and flushed every `flush_interval`
+    seconds in one bulk UPDATE, instead of a row update per request."""
+
+    def __init__(self, uow: UnitOfWork, flush_interval: float, max_pending_users: int):
+        self.uow = uow
+        self.flush_interval = flush_interval
+        self.max_pending_users = max_pending_users
+        # uid -> [last_login_at, last_seen_at, logins]
+        self._pending: Dict[UUID, list] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self.metrics = {
+            "recorded": 0,
+            "merged": 0,
+            "dropped": 0,
+            "flushed_users": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+        }
+
+    def _entry(self, uid: UUID) -> Optional[list]:
+        self.metrics["recorded"] += 1
+        entry = self._pending.get(uid)
+        if entry is not None:
+            self.metrics["merged"] += 1
+            return entry
+        if len(self._pending) >= self.max_pending_users:
+            self.metrics["dropped"] += 1
+            return None
+        entry = self._pending[uid] = [None, None, 0]
+        return entry
+
+    def record_login(self, uid: UUID) -> None:
+        entry = self._entry(uid)
+        if entry is not None:
+            now = datetime.now(UTC)
+            entry[0] = entry[1] = now
+            entry[2] += 1
+
+    def record_seen(self, uid: UUID) -> None:
+        entry = self._entry(uid)
+        if entry is not None:
+            entry[1] = datetime.now(UTC)
+
+    def _merge_back(self, pending: Dict[UUID, list]) -> None:
+        for uid, (last_login_at, last_seen_at, logins) in pending.items():
+            entry = self._pending.get(uid)
+            if entry is None:
+                if len(self._pending) >= self.max_pending_users:
+                    self.metrics["dropped"] += 1
+                    continue
+                self._pending[uid] = [last_login_at, last_seen_at, logins]
+                continue
+            entry[0] = entry[0] or last_login_at
+            entry[2] += logins
+
+    async def flush(self) -> int:
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        # sorted by id: workers flushing overlapping users lock rows in the same order
+        rows = [(uid, last_login_at, last_seen_at, logins)
+                for uid, (last_login_at, last_seen_at, logins) in sorted(pending.items())]
+        try:
+            async with self.uow() as uow:
+                await uow.users.apply_activity(rows)
+        except Exception as e:
+            self.metrics["failed_flushes"] += 1
+            logger.error("Activity flush of %d users failed: %s", len(rows), e)
+            self._merge_back(pending)
+            return 0
+        self.metrics["flushes"] += 1
+        self.metrics["flushed_users"] += len(rows)
+        return len(rows)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # flush on shutdown, the loop does a last flush after stop is signalled
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def snapshot(self) -> dict:
+        return {**self.metrics, "pending_users": len(self._pending)}
+
+
+activity_buffer = ActivityBuffer(
+    UnitOfWork(),
+    flush_interval=ACTIVITY_FLUSH_INTERVAL,
+    max_pending_users=ACTIVITY_MAX_PENDING_USERS,
+)
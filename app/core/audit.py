@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, UTC
+from typing import Optional
+from uuid import UUID
+from app.core.config import (
+    AUDIT_QUEUE_SIZE,
+    AUDIT_BATCH_SIZE,
+    AUDIT_FLUSH_INTERVAL,
+    AUDIT_OVERFLOW_POLICY,
+)
+from app.core.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+
+class AuditLog:
+    """In-process bounded queue of audit events.
+    Services call `emit` (no I/O), a background writer flushes batches to
+    audit_events in one multi-row INSERT when `batch_size` events are queued
+    or every `flush_interval` seconds."""
+
+    def __init__(self, uow: UnitOfWork, max_size: int, batch_size: int,
+                 flush_interval: float, overflow_policy: str = DROP_OLDEST):
+        if overflow_policy not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        self.uow = uow
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self._queue = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.metrics = {
+            "emitted": 0,
+            "dropped": 0,
+            "flushed": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+            "last_flush_ms": 0.0,
+        }
+
+    def emit(self, event_type: str, user_id: Optional[UUID] = None,
+             actor_id: Optional[UUID] = None, **data) -> None:
+        event = {
+            "event_type": event_type,
+            "user_id": user_id,
+            "actor_id": actor_id,
+            "data": data or None,
+            "created_at": datetime.now(UTC),
+        }
+        self.metrics["emitted"] += 1
+        if not self._enqueue(event):
+            return
+        if len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+
+    def _enqueue(self, event: dict, left: bool = False) -> bool:
+        if len(self._queue) >= self.max_size:
+            self.metrics["dropped"] += 1
+            if self.overflow_policy == DROP_NEWEST:
+                return False
+            if left:
+                return False  # requeued events are older than everything queued
+            self._queue.popleft()
+        if left:
+            self._queue.appendleft(event)
+        else:
+            self._queue.append(event)
+        return True
+
+    async def flush(self) -> int:
+        flushed = 0
+        while self._queue:
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            started = time.perf_counter()
+            try:
+                async with self.uow() as uow:
+                    await uow.audit.add_many(batch)
+            except Exception as e:
+                self.metrics["failed_flushes"] += 1
+                logger.error("Audit flush of %d events failed: %s", len(batch), e)
+                # keep events for the next attempt, preserving order
+                for event in reversed(batch):
+                    self._enqueue(event, left=True)
+                break
+            self.metrics["flushes"] += 1
+            self.metrics["flushed"] += len(batch)
+            self.metrics["last_flush_ms"] = (time.perf_counter() - started) * 1000
+            flushed += len(batch)
+        return flushed
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # not cancel(): a batch in flight must not be lost
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def snapshot(self) -> dict:
+        return {**self.metrics, "queue_depth": len(self._queue)}
+
+
+audit_log = AuditLog(
+    UnitOfWork(),
+    max_size=AUDIT_QUEUE_SIZE,
+    batch_size=AUDIT_BATCH_SIZE,
+    flush_interval=AUDIT_FLUSH_INTERVAL,
+    overflow_policy=AUDIT_OVERFLOW_POLICY,
+)
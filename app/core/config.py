@@ -12,6 +12,99 @@ DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 DB_NAME = os.getenv("DB_NAME")
-DATABASE_URL = (
+# In-memory SQLite, shared cache so every pooled connection sees the same database
+IN_MEMORY_DATABASE_URL = "sqlite+aiosqlite:///file:coffee_shop?mode=memory&cache=shared&uri=true"
+# DATABASE_URL overrides DB_*; DATABASE_URL=memory runs on in-memory SQLite (tests, benchmarks)
+DATABASE_URL = os.getenv("DATABASE_URL") or (
     f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
+if DATABASE_URL == "memory":
+    DATABASE_URL = IN_MEMORY_DATABASE_URL
+
+# Startup / shutdown
+DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", "2"))  # connections opened before serving
+SHUTDOWN_DRAIN_TIMEOUT = float(os.getenv("SHUTDOWN_DRAIN_TIMEOUT", "10"))  # seconds
+
+# Per-process resources, `serve.py` splits the fleet-wide budget across workers
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", "4"))
+
+# Serving (serve.py)
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8000"))
+WEB_WORKERS = int(os.getenv("WEB_WORKERS", "0"))  # 0 = one per CPU
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "100"))  # Postgres max_connections
+DB_RESERVED_CONNECTIONS = int(os.getenv("DB_RESERVED_CONNECTIONS", "10"))  # celery, alembic, psql
+HASH_THREADS_TOTAL = int(os.getenv("HASH_THREADS_TOTAL", "0"))  # 0 = one per CPU
+GRACEFUL_SHUTDOWN_TIMEOUT = int(os.getenv("GRACEFUL_SHUTDOWN_TIMEOUT", "30"))
+WORKER_READY_DIR = os.getenv("WORKER_READY_DIR")  # each worker touches <dir>/<pid> once warmed up
+WORKER_READY_TIMEOUT = float(os.getenv("WORKER_READY_TIMEOUT", "60"))
+
+# Audit log writer (app.core.audit)
+AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", "1.0"))  # seconds
+AUDIT_OVERFLOW_POLICY = os.getenv("AUDIT_OVERFLOW_POLICY", "drop_oldest")  # or drop_newest
+
+# Write-behind login / last seen tracking (app.core.activity)
+ACTIVITY_FLUSH_INTERVAL = float(os.getenv("ACTIVITY_FLUSH_INTERVAL", "30"))  # seconds
+ACTIVITY_MAX_PENDING_USERS = int(os.getenv("ACTIVITY_MAX_PENDING_USERS", "100000"))
+
+# Redis / Celery
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://redis:6379/1")
+# Maintenance task schedules, seconds between runs
+CLEANUP_UNVERIFIED_INTERVAL = float(os.getenv("CLEANUP_UNVERIFIED_INTERVAL", str(60 * 60 * 24)))
+STATS_RECONCILE_INTERVAL = float(os.getenv("STATS_RECONCILE_INTERVAL", str(60 * 60)))
+# Lease of a running maintenance task, renewed by heartbeat while it runs
+TASK_LOCK_TTL = float(os.getenv("TASK_LOCK_TTL", "300"))
+
+# Query profiling (app.db.profiler)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"  # log every statement, very noisy
+QUERY_PROFILER_ENABLED = os.getenv("QUERY_PROFILER_ENABLED", "true").lower() == "true"
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+EXPLAIN_SAMPLE_RATE = float(os.getenv("EXPLAIN_SAMPLE_RATE", "0"))  # share of slow SELECTs to EXPLAIN ANALYZE
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "10"))  # same statement per request
+
+# Adaptive concurrency limit / load shedding (app.core.load_shedding)
+LOAD_SHEDDING_ENABLED = os.getenv("LOAD_SHEDDING_ENABLED", "true").lower() == "true"
+CONCURRENCY_INITIAL_LIMIT = int(os.getenv("CONCURRENCY_INITIAL_LIMIT", "32"))
+CONCURRENCY_MIN_LIMIT = int(os.getenv("CONCURRENCY_MIN_LIMIT", "4"))
+CONCURRENCY_MAX_LIMIT = int(os.getenv("CONCURRENCY_MAX_LIMIT", "512"))
+LATENCY_TARGET_MS = float(os.getenv("LATENCY_TARGET_MS", "250"))
+QUEUE_BUDGET_MS = float(os.getenv("QUEUE_BUDGET_MS", "500"))
+
+# POST /users/batch
+BATCH_LOOKUP_MAX = int(os.getenv("BATCH_LOOKUP_MAX", "1000"))  # ids + emails per request
+BATCH_LOOKUP_CHUNK = int(os.getenv("BATCH_LOOKUP_CHUNK", "500"))  # keys per query
+
+# Resend verification email
+RATE_STORE = os.getenv("RATE_STORE", "redis")  # redis (shared by all workers) or memory
+RESEND_COOLDOWN_SECONDS = int(os.getenv("RESEND_COOLDOWN_SECONDS", "60"))
+RESEND_DAILY_CAP = int(os.getenv("RESEND_DAILY_CAP", "5"))
+
+# Group commit of concurrent signups (app.repositories.SignupWriter)
+SIGNUP_GROUP_COMMIT = os.getenv("SIGNUP_GROUP_COMMIT", "false").lower() == "true"
+SIGNUP_BATCH_MAX = int(os.getenv("SIGNUP_BATCH_MAX", "100"))
+SIGNUP_BATCH_WAIT_MS = float(os.getenv("SIGNUP_BATCH_WAIT_MS", "5"))
+
+# Statement caches: SQLAlchemy compiled SQL per engine, asyncpg prepared statements per connection
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "500"))
+DB_PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "500"))
+
+# Token revocation list: "redis" replicates it across workers (pub/sub), "memory" keeps it per process
+REVOCATION_SYNC = os.getenv("REVOCATION_SYNC", "redis")
+REVOCATION_SWEEP_INTERVAL = float(os.getenv("REVOCATION_SWEEP_INTERVAL", "30"))
+
+# Purge of soft deleted users (Celery beat): rows per transaction, batches per run, grace before purge
+PURGE_DELETED_INTERVAL = float(os.getenv("PURGE_DELETED_INTERVAL", str(60 * 10)))
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", "500"))
+PURGE_MAX_BATCHES = int(os.getenv("PURGE_MAX_BATCHES", "100"))
+PURGE_GRACE_SECONDS = int(os.getenv("PURGE_GRACE_SECONDS", "0"))
+
+# Readiness probes (app.core.health), run in the background and served from the last result
+HEALTH_PROBE_INTERVAL = float(os.getenv("HEALTH_PROBE_INTERVAL", "5"))
+HEALTH_PROBE_TIMEOUT = float(os.getenv("HEALTH_PROBE_TIMEOUT", "2"))
+HEALTH_EXECUTOR_MAX_QUEUE = int(os.getenv("HEALTH_EXECUTOR_MAX_QUEUE", "64"))
+HEALTH_MAX_LOOP_LAG_MS = float(os.getenv("HEALTH_MAX_LOOP_LAG_MS", "500"))
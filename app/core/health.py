@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+from redis import asyncio as aioredis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.config import (
+    REDIS_URL,
+    RATE_STORE,
+    REVOCATION_SYNC,
+    HEALTH_PROBE_INTERVAL,
+    HEALTH_PROBE_TIMEOUT,
+    HEALTH_EXECUTOR_MAX_QUEUE,
+    HEALTH_MAX_LOOP_LAG_MS,
+)
+from app.core.security import executor, HashingExecutor
+from app.db.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """Dependency probes run in the background every `interval` seconds;
+    readiness checks only read the last report, so a load balancer probing
+    every pod often costs no query. A report older than a few intervals
+    means the probe loop itself is starved and counts as not ready."""
+
+    def __init__(self, engine: AsyncEngine, redis: Optional[aioredis.Redis],
+                 executor: HashingExecutor, interval: float, timeout: float,
+                 executor_max_queue: int, max_loop_lag_ms: float):
+        self.engine = engine
+        self.redis = redis
+        self.executor = executor
+        self.interval = interval
+        self.timeout = timeout
+        self.executor_max_queue = executor_max_queue
+        self.max_loop_lag_ms = max_loop_lag_ms
+        self._report: Optional[dict] = None
+        self._checked_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _probe_database(self) -> dict:
+        pool = self.engine.pool
+        state = {"pool_size": pool.size(), "checked_out": pool.checkedout(), "overflow": pool.overflow()}
+        started = time.perf_counter()
+        try:
+            # waits for a free connection: an exhausted pool fails the probe
+            async with asyncio.timeout(self.timeout):
+                async with self.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except Exception as e:
+            return {"ok": False, "error": str(e) or type(e).__name__, **state}
+        return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2), **state}
+
+    async def _probe_redis(self) -> dict:
+        if self.redis is None:
+            return {"ok": True, "enabled": False}
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout):
+                await self.redis.ping()
+        except Exception as e:
+            return {"ok": False, "error": str(e) or type(e).__name__}
+        return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+    def _probe_executor(self) -> dict:
+        queued = self.executor.queued
+        return {
+            "ok": queued <= self.executor_max_queue,
+            "workers": self.executor.workers,
+            "queued": queued,
+        }
+
+    async def probe(self, loop_lag_ms: float = 0.0) -> dict:
+        database, redis = await asyncio.gather(self._probe_database(), self._probe_redis())
+        checks = {
+            "database": database,
+            "redis": redis,
+            "executor": self._probe_executor(),
+            "event_loop": {"ok": loop_lag_ms <= self.max_loop_lag_ms, "lag_ms": round(loop_lag_ms, 2)},
+        }
+        self._report = checks
+        self._checked_at = time.monotonic()
+        failed = [name for name, check in checks.items() if not check["ok"]]
+        if failed:
+            logger.warning("Not ready, failed checks: %s", ", ".join(failed))
+        return checks
+
+    async def _run(self) -> None:
+        lag_ms = 0.0
+        while True:
+            try:
+                await self.probe(lag_ms)
+            except Exception as e:
+                logger.error("Health probe failed: %s", e)
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            # how late the loop woke us up: a busy event loop delays every request
+            lag_ms = max(0.0, (time.monotonic() - expected) * 1000)
+
+    def readiness(self) -> tuple[bool, dict]:
+        if self._report is None:
+            return False, {"status": "starting"}
+        age = time.monotonic() - self._checked_at
+        stale = age > self.interval * 3
+        ready = not stale and all(check["ok"] for check in self._report.values())
+        return ready, {
+            "status": "ready" if ready else "unavailable",
+            "checked_ms_ago": round(age * 1000),
+            "stale": stale,
+            "checks": self._report,
+        }
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # by lifespan shutdown uvicorn has closed its sockets already, probes
+        # fail to connect and the load balancer takes the instance out
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+health_monitor = HealthMonitor(
+    engine,
+    aioredis.Redis.from_url(REDIS_URL) if "redis" in (RATE_STORE, REVOCATION_SYNC) else None,
+    executor,
+    interval=HEALTH_PROBE_INTERVAL,
+    timeout=HEALTH_PROBE_TIMEOUT,
+    executor_max_queue=HEALTH_EXECUTOR_MAX_QUEUE,
+    max_loop_lag_ms=HEALTH_MAX_LOOP_LAG_MS,
+)
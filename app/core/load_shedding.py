@@ -0,0 +1,185 @@
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Optional
+from app.core.config import (
+    CONCURRENCY_INITIAL_LIMIT,
+    CONCURRENCY_MIN_LIMIT,
+    CONCURRENCY_MAX_LIMIT,
+    LATENCY_TARGET_MS,
+    QUEUE_BUDGET_MS,
+)
+
+CRITICAL = "critical"
+NORMAL = "normal"
+SHEDDABLE = "sheddable"
+# admission order when capacity frees up
+PRIORITIES = (CRITICAL, NORMAL, SHEDDABLE)
+
+# class -> (share of the limit it may use, share of the queue budget it may wait)
+# auth-heavy routes (argon2, inserts) get the smallest share and shed first
+CLASS_POLICY = {
+    CRITICAL: (1.0, 1.0),
+    NORMAL: (0.9, 1.0),
+    SHEDDABLE: (0.6, 0.25),
+}
+CRITICAL_PATHS = ("/health", "/me", "/auth/refresh", "/auth/logout", "/auth/revoke-all", "/debug")
+SHEDDABLE_PATHS = ("/auth/signup", "/auth/login", "/auth/verify", "/auth/resend-verification")
+
+DEADLINE_HEADER = b"x-request-deadline-ms"  # time the client is still willing to wait
+
+
+def classify(path: str) -> str:
+    if path == "/" or path.startswith(CRITICAL_PATHS):
+        return CRITICAL
+    if path.startswith(SHEDDABLE_PATHS):
+        return SHEDDABLE
+    return NORMAL
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit: +1/limit per fast response, x0.9 on a slow one
+    (at most once per latency target, so one burst of slow responses counts once)"""
+
+    def __init__(self, initial: int, min_limit: int, max_limit: int,
+                 latency_target_ms: float, queue_budget_ms: float):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target_ms / 1000
+        self.queue_budget = queue_budget_ms / 1000
+        self.inflight = 0
+        self._waiters = {priority: deque() for priority in PRIORITIES}
+        self._last_decrease = 0.0
+        self.metrics = {
+            "admitted": {priority: 0 for priority in PRIORITIES},
+            "shed": {priority: 0 for priority in PRIORITIES},
+            "decreases": 0,
+        }
+
+    def _has_capacity(self, priority: str) -> bool:
+        return self.inflight < max(1.0, self.limit * CLASS_POLICY[priority][0])
+
+    def _wake(self) -> None:
+        for priority in PRIORITIES:
+            waiters = self._waiters[priority]
+            while waiters and self._has_capacity(priority):
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    self.inflight += 1
+                    waiter.set_result(True)
+
+    async def acquire(self, priority: str, deadline: Optional[float] = None) -> bool:
+        """False means shed: no capacity within the queue budget (or client deadline)"""
+        queued_ahead = any(self._waiters[p] for p in PRIORITIES[:PRIORITIES.index(priority) + 1])
+        if not queued_ahead and self._has_capacity(priority):
+            self.inflight += 1
+            self.metrics["admitted"][priority] += 1
+            return True
+
+        budget = self.queue_budget * CLASS_POLICY[priority][1]
+        if deadline is not None:
+            budget = min(budget, deadline)
+        if budget <= 0:
+            self.metrics["shed"][priority] += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=budget)
+        except asyncio.TimeoutError:
+            self._forget(priority, waiter)
+            self.metrics["shed"][priority] += 1
+            return False
+        except asyncio.CancelledError:
+            # client went away while queued
+            self._forget(priority, waiter)
+            raise
+        self.metrics["admitted"][priority] += 1
+        return True
+
+    def _forget(self, priority: str, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters[priority].remove(waiter)
+        except ValueError:
+            pass
+        # granted a slot just before giving up: hand it to the next waiter
+        if waiter.done() and not waiter.cancelled():
+            self.inflight -= 1
+            self._wake()
+
+    def release(self, latency: float) -> None:
+        self.inflight -= 1
+        now = time.monotonic()
+        if latency > self.latency_target:
+            if now - self._last_decrease > self.latency_target:
+                self.limit = max(self.min_limit, self.limit * 0.9)
+                self._last_decrease = now
+                self.metrics["decreases"] += 1
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self._wake()
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": round(self.limit, 2),
+            "inflight": self.inflight,
+            "queued": {priority: len(self._waiters[priority]) for priority in PRIORITIES},
+            **self.metrics,
+        }
+
+
+class LoadSheddingMiddleware:
+    """Admits requests through the adaptive limiter, answers 503 + Retry-After
+    when a request would wait longer than its queue budget"""
+
+    def __init__(self, app, limiter: AdaptiveLimiter, retry_after: int = 1):
+        self.app = app
+        self.limiter = limiter
+        self.retry_after = retry_after
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        priority = classify(scope["path"])
+        if not await self.limiter.acquire(priority, deadline=self._deadline(scope)):
+            return await self._reject(send)
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.limiter.release(time.monotonic() - started)
+
+    @staticmethod
+    def _deadline(scope) -> Optional[float]:
+        for name, value in scope["headers"]:
+            if name == DEADLINE_HEADER:
+                try:
+                    return float(value) / 1000
+                except ValueError:
+                    return None
+        return None
+
+    async def _reject(self, send) -> None:
+        body = json.dumps({"detail": "Service overloaded, retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(self.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+limiter = AdaptiveLimiter(
+    initial=CONCURRENCY_INITIAL_LIMIT,
+    min_limit=CONCURRENCY_MIN_LIMIT,
+    max_limit=CONCURRENCY_MAX_LIMIT,
+    latency_target_ms=LATENCY_TARGET_MS,
+    queue_budget_ms=QUEUE_BUDGET_MS,
+)
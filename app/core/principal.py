@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from uuid import UUID
+from app.db.User import UserRole
+
+
+# Authenticated caller on the internal auth path. Plain slotted object instead of
+# UserReadSchema: no pydantic / EmailStr validation on every request
+@dataclass(frozen=True, slots=True)
+class Principal:
+    id: UUID
+    role: UserRole
+    is_verified: bool
+    token_version: int
@@ -0,0 +1,58 @@
+import time
+from typing import Dict, Tuple
+from redis import asyncio as aioredis
+from app.core.config import RATE_STORE, REDIS_URL
+
+
+class MemoryRateStore:
+    """Per-process store, for a single worker or local runs"""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[int, float]] = {}
+
+    def _get(self, key: str):
+        item = self._data.get(key)
+        if item is not None and item[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return item
+
+    async def claim(self, key: str, ttl: int) -> bool:
+        """True if the key was free; it is then held for `ttl` seconds"""
+        if self._get(key) is not None:
+            return False
+        self._data[key] = (1, time.monotonic() + ttl)
+        return True
+
+    async def incr(self, key: str, ttl: int) -> int:
+        """Counter in a window of `ttl` seconds starting at the first increment"""
+        item = self._get(key)
+        value, expires_at = item if item is not None else (0, time.monotonic() + ttl)
+        self._data[key] = (value + 1, expires_at)
+        return value + 1
+
+
+class RedisRateStore:
+    """Shared by all workers"""
+
+    def __init__(self, client: aioredis.Redis):
+        self.client = client
+
+    async def claim(self, key: str, ttl: int) -> bool:
+        return bool(await self.client.set(key, 1, nx=True, ex=ttl))
+
+    async def incr(self, key: str, ttl: int) -> int:
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, ttl, nx=True)
+            value, _ = await pipe.execute()
+        return value
+
+
+def create_rate_store():
+    if RATE_STORE == "memory":
+        return MemoryRateStore()
+    return RedisRateStore(aioredis.Redis.from_url(REDIS_URL))
+
+
+rate_store = create_rate_store()
@@ -0,0 +1,151 @@
+import asyncio
+import heapq
+import json
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+from redis import asyncio as aioredis
+from app.core.config import REVOCATION_SYNC, REDIS_URL, REVOCATION_SWEEP_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "auth:revocations"
+# sorted set, score = expiry: lets a starting worker load what is still relevant
+SNAPSHOT_KEY = "auth:revoked"
+# no token lives longer than the refresh token
+MAX_TOKEN_LIFETIME = 60 * 60 * 24 * 7
+
+
+class RevocationList:
+    """Revoked token ids (jti) and per-user cutoffs (tokens issued before are revoked).
+    Kept in memory so `is_revoked` is a dict lookup without I/O; entries are
+    dropped once the tokens they cover have expired. With a Redis client the
+    list is replicated: changes are published on a channel every worker listens
+    to, and kept in a sorted set for workers that start later."""
+
+    def __init__(self, client: Optional[aioredis.Redis], sweep_interval: float):
+        self.client = client
+        self.sweep_interval = sweep_interval
+        self._jti: Dict[str, float] = {}  # jti -> exp
+        self._users: Dict[str, float] = {}  # sub -> issued-before cutoff
+        self._expiry: List[Tuple[float, str, str]] = []  # heap of (expires_at, kind, key)
+        self._task: Optional[asyncio.Task] = None
+
+    def is_revoked(self, payload: dict) -> bool:
+        jti = payload.get("jti")
+        if jti is not None and jti in self._jti:
+            return True
+        cutoff = self._users.get(payload.get("sub"))
+        return cutoff is not None and payload.get("iat", 0) <= cutoff
+
+    def _add(self, kind: str, key: str, value: float, expires_at: float) -> None:
+        if expires_at <= time.time():
+            return
+        entries = self._jti if kind == "jti" else self._users
+        if entries.get(key, 0) >= value:
+            return
+        entries[key] = value
+        heapq.heappush(self._expiry, (expires_at, kind, key))
+
+    def sweep(self) -> int:
+        now = time.time()
+        removed = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, kind, key = heapq.heappop(self._expiry)
+            entries = self._jti if kind == "jti" else self._users
+            value = entries.get(key)
+            # a later cutoff for the same user pushed its own, later expiry
+            if value is not None and (kind == "jti" or value + MAX_TOKEN_LIFETIME <= expires_at):
+                del entries[key]
+                removed += 1
+        return removed
+
+    def _apply(self, message: dict) -> None:
+        if message["kind"] == "jti":
+            self._add("jti", message["key"], message["value"], message["value"])
+        else:
+            self._add("user", message["key"], message["value"], message["value"] + MAX_TOKEN_LIFETIME)
+
+    async def _publish(self, message: dict, expires_at: float) -> None:
+        self._apply(message)
+        if self.client is None:
+            return
+        data = json.dumps(message)
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.zadd(SNAPSHOT_KEY, {data: expires_at})
+                pipe.publish(CHANNEL, data)
+                await pipe.execute()
+        except Exception as e:
+            # still revoked in this worker, others accept the token until it expires
+            logger.error("Revocation sync failed: %s", e)
+
+    async def revoke(self, jti: str, exp: float) -> None:
+        """Revoke one token until its expiry"""
+        await self._publish({"kind": "jti", "key": jti, "value": exp}, exp)
+
+    async def revoke_user(self, sub: str, cutoff: Optional[float] = None) -> None:
+        """Revoke every token of the user issued up to `cutoff` (now by default)"""
+        cutoff = time.time() if cutoff is None else cutoff
+        await self._publish({"kind": "user", "key": sub, "value": cutoff}, cutoff + MAX_TOKEN_LIFETIME)
+
+    async def load(self) -> int:
+        now = time.time()
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(SNAPSHOT_KEY, "-inf", now)
+            pipe.zrangebyscore(SNAPSHOT_KEY, now, "+inf")
+            _, items = await pipe.execute()
+        for item in items:
+            self._apply(json.loads(item))
+        return len(items)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(CHANNEL)
+                    # after subscribing: nothing published meanwhile is missed
+                    loaded = await self.load()
+                    logger.info("Loaded %d revocations", loaded)
+                    last_sweep = time.monotonic()
+                    while True:
+                        message = await pubsub.get_message(timeout=self.sweep_interval)
+                        if message is not None:
+                            self._apply(json.loads(message["data"]))
+                        if time.monotonic() - last_sweep >= self.sweep_interval:
+                            self.sweep()
+                            last_sweep = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Revocation listener failed, retrying: %s", e)
+                await asyncio.sleep(self.sweep_interval)
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.sweep()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen() if self.client is not None else self._sweep_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def snapshot(self) -> dict:
+        return {"tokens": len(self._jti), "users": len(self._users), "replicated": self.client is not None}
+
+
+def create_revocation_list() -> RevocationList:
+    client = aioredis.Redis.from_url(REDIS_URL) if REVOCATION_SYNC == "redis" else None
+    return RevocationList(client, sweep_interval=REVOCATION_SWEEP_INTERVAL)
+
+
+revocations = create_revocation_list()
@@ -1,16 +1,62 @@
 import asyncio
+import threading
+import time
+import uuid
 from datetime import timedelta, datetime, UTC
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from app.core.config import JWT_SECRET_KEY
+from app.core.config import JWT_SECRET_KEY, HASH_WORKERS
+from app.core.revocation import revocations
 from concurrent.futures import ThreadPoolExecutor
 
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 15
 
+_WARMUP_PASSWORD = "warmup-password"
+
 pwd_context = CryptContext(schemes=['argon2'], deprecated='auto')
-executor = ThreadPoolExecutor(max_workers=4)
+
+
+class HashingExecutor:
+    """Thread pool for argon2 that counts the tasks submitted and not yet
+    finished, so the health check reads its queue depth without touching
+    ThreadPoolExecutor internals"""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+
+    def _done(self, _future) -> None:
+        # runs in the worker thread
+        with self._lock:
+            self.pending -= 1
+
+    def run(self, fn, *args) -> asyncio.Future:
+        with self._lock:
+            self.pending += 1
+        try:
+            future = self._pool.submit(fn, *args)
+        except BaseException:
+            with self._lock:
+                self.pending -= 1
+            raise
+        # decremented when the thread finishes, even if the awaiting request was cancelled
+        future.add_done_callback(self._done)
+        return asyncio.wrap_future(future)
+
+    @property
+    def queued(self) -> int:
+        """Tasks waiting for a free thread"""
+        return max(0, self.pending - self.workers)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+executor = HashingExecutor(HASH_WORKERS)
 
 
 def hash_password(password: str) -> str:
@@ -19,15 +65,22 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def hash_password_async(password: str) -> str:
+    if not password:
+        raise ValueError("Password cannot be empty")
+    return await executor.run(pwd_context.hash, password)
+
+
 async def verify_password(password: str, hashed_password: str) -> bool:
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(executor, pwd_context.verify, password, hashed_password)
+    return await executor.run(pwd_context.verify, password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(UTC) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({'exp': expire,
+                      "iat": time.time(),
+                      "jti": uuid.uuid4().hex,
                       "type": "access"})
     return jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=ALGORITHM)
 
@@ -35,7 +88,10 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 def create_refresh_token(data: dict):
     expire = datetime.now(UTC) + timedelta(days=7)
     to_encode = {"sub": data["sub"],
+                 "ver": data.get("ver", 0),
                  "exp": expire,
+                 "iat": time.time(),
+                 "jti": uuid.uuid4().hex,
                  "type": "refresh"}
     return jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=ALGORITHM)
 
@@ -45,6 +101,22 @@ def decode_token(token: str, expected_type: str) -> Optional[dict]:
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[ALGORITHM])
         if payload.get("type") != expected_type:
             return None
+        if revocations.is_revoked(payload):
+            return None
         return payload
     except JWTError:
         return None
+
+
+async def warmup_executor() -> None:
+    """Start every hashing thread and load the argon2 backend before the first login"""
+    hashed = await executor.run(pwd_context.hash, _WARMUP_PASSWORD)
+    await asyncio.gather(*(
+        executor.run(pwd_context.verify, _WARMUP_PASSWORD, hashed)
+        for _ in range(HASH_WORKERS)
+    ))
+
+
+def warmup_token_codec() -> None:
+    token = create_access_token({"sub": "warmup"}, expires_delta=timedelta(minutes=1))
+    decode_token(token, expected_type="access")
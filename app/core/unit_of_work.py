@@ -1,12 +1,16 @@
 from app.db.database import new_session
 from contextlib import asynccontextmanager
 from app.repositories.UserRepo import UserRepository
+from app.repositories.UserStatsRepo import UserStatsRepository
+from app.repositories.AuditRepo import AuditRepository
 
 
 class _UnitOfWork:
     def __init__(self, session):
         self.session = session
         self.users = UserRepository(session)
+        self.stats = UserStatsRepository(session)
+        self.audit = AuditRepository(session)
 
 
 class UnitOfWork:
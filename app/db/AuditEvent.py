@@ -0,0 +1,24 @@
+from sqlalchemy import String, BigInteger, Integer, DateTime, JSON, Index, Uuid
+from sqlalchemy.orm import mapped_column, Mapped
+from datetime import datetime
+from typing import Optional
+import uuid
+from app.db.database import Base
+
+
+# Audit trail of user changes, written in batches by app.core.audit
+class AuditEventModel(Base):
+    __tablename__ = "audit_events"
+    __table_args__ = (
+        Index("ix_audit_events_user_id_created_at", "user_id", "created_at"),
+    )
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"),
+                                    primary_key=True, autoincrement=True)
+    event_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid(as_uuid=True), nullable=True)
+    actor_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid(as_uuid=True), nullable=True)
+    data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<AuditEvent id={self.id}, type={self.event_type}, user_id={self.user_id}>"
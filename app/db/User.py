@@ -1,9 +1,9 @@
-from sqlalchemy import String, Boolean, DateTime
+from sqlalchemy import String, Boolean, DateTime, Integer, Index, Uuid, Enum as SAEnum, text
 from sqlalchemy.orm import mapped_column, Mapped
 from datetime import datetime
+from typing import Optional
 from enum import Enum
 import uuid
-from sqlalchemy.dialects.postgresql import UUID, ENUM
 from app.db.database import Base
 
 
@@ -16,15 +16,28 @@ class UserRole(str, Enum):
 # User table model
 class UserModel(Base):
     __tablename__ = "users_table"
+    # pg_trgm GIN indexes for admin search (partial / fuzzy matching)
+    __table_args__ = tuple(
+        Index(f"ix_users_table_{column}_trgm", column,
+              postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+        for column in ("email", "name", "surname")
+    ) + (
+        # soft delete: email is unique among live users only, so it can be reused right away
+        Index("ix_users_table_email", "email", unique=True,
+              postgresql_where=text("deleted_at IS NULL"), sqlite_where=text("deleted_at IS NULL")),
+        # small index over the rows waiting for the purge task
+        Index("ix_users_table_deleted_at", "deleted_at",
+              postgresql_where=text("deleted_at IS NOT NULL"), sqlite_where=text("deleted_at IS NOT NULL")),
+    )
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4
     )
-    email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    role: Mapped[UserRole] = mapped_column(ENUM(UserRole, name="user_role", create_type=True), nullable=False)
+    role: Mapped[UserRole] = mapped_column(SAEnum(UserRole, name="user_role"), nullable=False)
     name: Mapped[str] = mapped_column(String(255), default="None", nullable=True)
     surname: Mapped[str] = mapped_column(String(255), default="None", nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True),
@@ -36,6 +49,14 @@ class UserModel(Base):
         onupdate=datetime.utcnow,
         nullable=False
     )
+    # Activity, written behind by app.core.activity
+    last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    login_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    # Embedded in tokens as "ver", bumping it invalidates issued tokens
+    token_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    # Set by DELETE /users/{id}; the row and its dependents are removed later by the purge task
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     def __repr__(self) -> str:
         return f"<User id={self.id}, email={self.email}, role={self.role}>"
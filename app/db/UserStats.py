@@ -0,0 +1,18 @@
+from datetime import date
+from sqlalchemy import String, BigInteger, Date
+from sqlalchemy.orm import mapped_column, Mapped
+from app.db.database import Base
+
+
+# Named counters (total, role:<role>, verified, unverified), maintained incrementally
+class UserCounterModel(Base):
+    __tablename__ = "user_counters"
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+
+# Signups per day
+class UserSignupDailyModel(Base):
+    __tablename__ = "user_signups_daily"
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
@@ -1,15 +1,44 @@
+import asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
-from app.core.config import DATABASE_URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.dialects import postgresql, sqlite
+from app.core.config import (
+    DATABASE_URL,
+    IN_MEMORY_DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_ECHO,
+    QUERY_PROFILER_ENABLED,
+    DB_QUERY_CACHE_SIZE,
+    DB_PREPARED_STATEMENT_CACHE_SIZE
+)
+from app.db.profiler import profiler
+
+
+def _engine_options(url: str) -> dict:
+    if url == IN_MEMORY_DATABASE_URL:
+        # single connection, never recycled: keeps the in-memory database alive
+        # and serializes access to it (sqlite has no row level locking anyway)
+        return {"poolclass": AsyncAdaptedQueuePool, "pool_size": 1, "max_overflow": 0}
+    options = {
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+    }
+    if url.startswith("postgresql+asyncpg"):
+        # per connection LRU of prepared statements, keyed by SQL text
+        options["connect_args"] = {"prepared_statement_cache_size": DB_PREPARED_STATEMENT_CACHE_SIZE}
+    return options
 
 
 # async engine
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=True,
-    pool_pre_ping=True,
-    pool_recycle=3600
-)
+engine = create_async_engine(DATABASE_URL, echo=DB_ECHO, query_cache_size=DB_QUERY_CACHE_SIZE,
+                             **_engine_options(DATABASE_URL))
+if QUERY_PROFILER_ENABLED:
+    profiler.attach(engine)
 # session maker object for opening session to connect to DB
 new_session = async_sessionmaker(
     engine,
@@ -24,6 +53,19 @@ class Base(DeclarativeBase):
     pass
 
 
+# Dialect of the session's connection, for postgres-only fast paths
+def dialect_name(session) -> str:
+    return session.get_bind().dialect.name
+
+
+# INSERT with ON CONFLICT support (same API on both dialects)
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def insert_for(session, target):
+    return _INSERTS[dialect_name(session)](target)
+
+
 # Function for getting session
 async def get_session() -> AsyncSession:
     async with new_session() as session:
@@ -36,3 +78,21 @@ async def get_session() -> AsyncSession:
             await session.close()
 
 
+# Open pooled connections up front, so first requests after deploy skip connection setup
+async def warmup_pool(size: int) -> int:
+    size = min(size, engine.pool.size())
+    if size <= 0:
+        return 0
+    connections = await asyncio.gather(*(engine.connect() for _ in range(size)))
+    try:
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in connections))
+    finally:
+        await asyncio.gather(*(conn.close() for conn in connections))
+    return size
+
+
+# Create tables without migrations (SQLite / in-memory mode, migrations are postgres-only)
+async def create_schema() -> None:
+    import app.db.User, app.db.UserStats, app.db.AuditEvent  # noqa: F401, register models
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
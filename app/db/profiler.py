@@ -0,0 +1,168 @@
+import functools
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.config import SLOW_QUERY_MS, EXPLAIN_SAMPLE_RATE, N_PLUS_ONE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# Per-request state set by QueryProfilerMiddleware: {"scope": ..., "statements": Counter}
+_request: ContextVar[Optional[dict]] = ContextVar("query_profiler_request", default=None)
+
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|\?|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+# asyncpg statements carry bind casts: IN ($1::UUID, $2::UUID)
+_LIST = re.compile(r"\(\s*\?(?:::[\w\s\[\]]+?)?(?:\s*,\s*\?(?:::[\w\s\[\]]+?)?)*\s*\)")
+_ROWS = re.compile(r"(\([^()]*\))(?:\s*,\s*\([^()]*\))+")
+_SPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """Statement with literals / placeholders replaced, so IN lists and
+    multi-row VALUES of any length share one entry. Cached: statement texts
+    come from the compiled cache, so there are few distinct ones"""
+    normalized = _SPACE.sub(" ", statement).strip()
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _LIST.sub("(?)", normalized)
+    return _ROWS.sub(r"\1", normalized)
+
+
+def _route(scope: dict) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or scope.get("path", "-")
+
+
+class QueryProfiler:
+    def __init__(self, slow_ms: float, explain_sample_rate: float, n_plus_one_threshold: int):
+        self.slow_ms = slow_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.n_plus_one_threshold = n_plus_one_threshold
+        # fingerprint -> [count, total_ms, max_ms, rows]
+        self.stats = {}
+        # compiled cache outcomes (cache_hit / cache_miss / ...), from the public context.cache_hit
+        self.compiled_stats = Counter()
+        # asyncpg prepared statement cache hit / miss, best effort (see _prepared_cache)
+        self.prepared_stats = Counter()
+
+    def attach(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after)
+
+    @staticmethod
+    def _prepared_cache(cursor):
+        """SQLAlchemy's asyncpg adapter keeps its prepared statements in a private
+        LRU keyed by SQL text. Not an API: None whenever it is not there (other
+        driver, or a version that moved it), the stats then stay empty"""
+        cache = getattr(getattr(cursor, "_adapt_connection", None), "_prepared_statement_cache", None)
+        return cache if hasattr(cache, "__contains__") else None
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        self.compiled_stats[context.cache_hit.name.lower()] += 1
+        # checked before execution: the statement is prepared during it
+        prepared = self._prepared_cache(cursor)
+        if prepared is not None:
+            self.prepared_stats["hit" if statement in prepared else "miss"] += 1
+        context._profiler_started = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - context._profiler_started) * 1000
+        key = fingerprint(statement)
+        # drivers buffer SELECT results, rowcount is only set for DML
+        rows = cursor.rowcount if cursor.rowcount >= 0 else len(getattr(cursor, "_rows", ()))
+
+        entry = self.stats.get(key)
+        if entry is None:
+            entry = self.stats[key] = [0, 0.0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += elapsed_ms
+        entry[2] = max(entry[2], elapsed_ms)
+        entry[3] += rows
+
+        request = _request.get()
+        if request is not None:
+            request["statements"][key] += 1
+
+        if elapsed_ms >= self.slow_ms:
+            route = _route(request["scope"]) if request else "-"
+            logger.warning("Slow query %.1f ms on %s: %s", elapsed_ms, route, key)
+            if (conn.dialect.name == "postgresql" and key.lstrip().upper().startswith("SELECT")
+                    and random.random() < self.explain_sample_rate):
+                self._explain(conn, statement, parameters)
+
+    @staticmethod
+    def _explain(conn, statement, parameters) -> None:
+        # separate cursor, the original one still holds the rows of the query
+        try:
+            cursor = conn.connection.cursor()
+            cursor.execute("EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+            cursor.close()
+            logger.warning("Plan:\n%s", plan)
+        except Exception as e:
+            logger.warning("EXPLAIN failed: %s", e)
+
+    def check_request(self, request: dict) -> None:
+        for key, count in request["statements"].items():
+            if count >= self.n_plus_one_threshold:
+                logger.warning("Possible N+1 on %s: %d x %s", _route(request["scope"]), count, key)
+
+    def top(self, n: int = 20, sort: str = "total_ms") -> list:
+        rows = [
+            {"statement": key, "count": count, "total_ms": round(total, 3),
+             "avg_ms": round(total / count, 3), "max_ms": round(max_ms, 3), "rows": rows}
+            for key, (count, total, max_ms, rows) in self.stats.items()
+        ]
+        rows.sort(key=lambda row: row[sort], reverse=True)
+        return rows[:n]
+
+    def cache_snapshot(self) -> dict:
+        compiled = self.compiled_stats["cache_hit"] + self.compiled_stats["cache_miss"]
+        prepared = self.prepared_stats["hit"] + self.prepared_stats["miss"]
+        return {
+            "compiled": {
+                **self.compiled_stats,
+                "hit_rate": round(self.compiled_stats["cache_hit"] / compiled, 4) if compiled else None,
+            },
+            # None when the driver internals it is read from are not available
+            "prepared_best_effort": {
+                **self.prepared_stats,
+                "hit_rate": round(self.prepared_stats["hit"] / prepared, 4),
+            } if prepared else None,
+        }
+
+    def reset(self) -> None:
+        self.stats.clear()
+        self.compiled_stats.clear()
+        self.prepared_stats.clear()
+
+
+class QueryProfilerMiddleware:
+    """Tracks statements per request for slow-query routes and N+1 detection"""
+
+    def __init__(self, app, profiler: QueryProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        request = {"scope": scope, "statements": Counter()}
+        token = _request.set(request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request.reset(token)
+            self.profiler.check_request(request)
+
+
+profiler = QueryProfiler(
+    slow_ms=SLOW_QUERY_MS,
+    explain_sample_rate=EXPLAIN_SAMPLE_RATE,
+    n_plus_one_threshold=N_PLUS_ONE_THRESHOLD,
+)
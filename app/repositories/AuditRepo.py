@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import select, insert, delete, or_, and_
+from app.db.AuditEvent import AuditEventModel
+
+
+class AuditRepository:
+    def __init__(self, session):
+        self.session = session
+
+    async def add_many(self, events: List[dict]) -> int:
+        if not events:
+            return 0
+        # one multi-row INSERT per batch
+        await self.session.execute(insert(AuditEventModel).values(events))
+        return len(events)
+
+    async def get_by_user(self, user_id: UUID, limit: int,
+                          before_created_at: Optional[datetime] = None,
+                          before_id: Optional[int] = None) -> List[AuditEventModel]:
+        stmt = select(AuditEventModel).where(AuditEventModel.user_id == user_id)
+        if before_created_at is not None and before_id is not None:
+            # keyset paging over (created_at DESC, id DESC)
+            stmt = stmt.where(or_(
+                AuditEventModel.created_at < before_created_at,
+                and_(AuditEventModel.created_at == before_created_at, AuditEventModel.id < before_id)
+            ))
+        stmt = stmt.order_by(AuditEventModel.created_at.desc(), AuditEventModel.id.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def delete_by_users(self, user_ids: List[UUID]) -> int:
+        """Events of purged users, by the (user_id, created_at) index"""
+        stmt = delete(AuditEventModel).where(AuditEventModel.user_id.in_(user_ids))
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from datetime import datetime, UTC
+from typing import List, Optional, Tuple
+from app.core.config import SIGNUP_BATCH_MAX, SIGNUP_BATCH_WAIT_MS
+from app.core.unit_of_work import UnitOfWork
+from app.db.User import UserModel
+from app.repositories.UserStatsRepo import user_deltas
+
+logger = logging.getLogger(__name__)
+
+
+class GroupCommitSignupWriter:
+    """Group commit for signups.
+    Rows submitted within `max_wait` seconds (or until `max_batch` are queued)
+    are written in one transaction with a single multi-row
+    INSERT ... ON CONFLICT (email) DO NOTHING RETURNING, and every caller gets
+    its own result: the created user, or None if the email already exists."""
+
+    def __init__(self, uow: UnitOfWork, max_batch: int, max_wait: float):
+        self.uow = uow
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending: List[Tuple[dict, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._writes = set()
+        self.metrics = {
+            "submitted": 0,
+            "created": 0,
+            "conflicts": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "max_batch_seen": 0,
+            "last_batch_ms": 0.0,
+        }
+
+    async def submit(self, row: dict) -> Optional[UserModel]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((row, future))
+        self.metrics["submitted"] += 1
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._write(batch))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: List[Tuple[dict, asyncio.Future]]) -> None:
+        # the same email twice in one batch: the first one wins, the rest conflict
+        rows = {}
+        for row, _ in batch:
+            rows.setdefault(row["email"], row)
+        started = time.perf_counter()
+        try:
+            async with self.uow() as uow:
+                created = await uow.users.add_many_if_absent(list(rows.values()))
+                if created:
+                    deltas = Counter()
+                    for user in created:
+                        deltas.update(user_deltas(user.role, False))
+                    await uow.stats.increment(dict(deltas))
+                    await uow.stats.increment_signups(datetime.now(UTC).date(), count=len(created))
+        except Exception as e:
+            self.metrics["failed_batches"] += 1
+            logger.error("Signup batch of %d rows failed: %s", len(batch), e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.metrics["batches"] += 1
+        self.metrics["max_batch_seen"] = max(self.metrics["max_batch_seen"], len(batch))
+        self.metrics["last_batch_ms"] = (time.perf_counter() - started) * 1000
+
+        by_email = {user.email: user for user in created}
+        for row, future in batch:
+            user = by_email.pop(row["email"], None)
+            if user is None:
+                self.metrics["conflicts"] += 1
+            else:
+                self.metrics["created"] += 1
+            # a cancelled caller (client went away) still got its row written
+            if not future.done():
+                future.set_result(user)
+
+    async def stop(self) -> None:
+        # write what is still queued and wait for batches in flight
+        self._flush()
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def snapshot(self) -> dict:
+        return {**self.metrics, "pending": len(self._pending), "in_flight": len(self._writes)}
+
+
+signup_writer = GroupCommitSignupWriter(
+    UnitOfWork(),
+    max_batch=SIGNUP_BATCH_MAX,
+    max_wait=SIGNUP_BATCH_WAIT_MS / 1000,
+)
@@ -1,10 +1,14 @@
-from app.db.User import UserModel
-from sqlalchemy import select, delete
+from app.db.User import UserModel, UserRole
+from sqlalchemy import select, delete, update, values, column, cast, func, or_, and_
+from sqlalchemy import Uuid, DateTime, Integer, Float, String, literal, bindparam, any_
+from sqlalchemy.dialects.postgresql import ARRAY
+from app.db.database import dialect_name, insert_for
+from app.core.config import BATCH_LOOKUP_CHUNK
 from uuid import UUID
 from abc import ABC
-from typing import Generic, TypeVar, List, Optional
+from typing import Generic, TypeVar, List, Optional, Tuple
 from sqlalchemy.exc import SQLAlchemyError
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, UTC
 
 T = TypeVar('T')
 
@@ -41,20 +45,90 @@ class BaseRepository(Generic[T], ABC):
             raise DataBaseError(f"Failed to add entity:{str(e)}")
 
 
+# Hot path statements, built once. A module level select() also memoizes its
+# compile cache key, so a call skips construction and key generation and goes
+# straight to the compiled form (and, on asyncpg, the prepared statement).
+# Soft deleted users are invisible to every read
+_LIVE = UserModel.deleted_at.is_(None)
+_BY_ID = select(UserModel).where(UserModel.id == bindparam("uid"), _LIVE)
+_BY_EMAIL = select(UserModel).where(UserModel.email == bindparam("email"), _LIVE)
+_PRINCIPAL_BY_ID = select(UserModel.id, UserModel.role, UserModel.is_verified,
+                          UserModel.token_version).where(UserModel.id == bindparam("uid"), _LIVE)
+_ROLE_BY_ID = select(UserModel.role).where(UserModel.id == bindparam("uid"), _LIVE)
+
+
 class UserRepository(BaseRepository[UserModel]):
     def __init__(self, session):
         super().__init__(UserModel, session)
 
+    async def get_by_id(self, uid: UUID) -> Optional[UserModel]:
+        result = await self.session.execute(_BY_ID, {"uid": uid})
+        return result.scalars().first()
+
     async def get_by_email(self, email: str) -> UserModel:
-        stmt = select(UserModel).where(UserModel.email == email)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_BY_EMAIL, {"email": email})
         return result.scalars().first()
 
+    async def add_many_if_absent(self, rows: List[dict]) -> List[UserModel]:
+        """One multi-row INSERT ... ON CONFLICT (email) DO NOTHING RETURNING,
+        only the rows that were actually inserted come back"""
+        if not rows:
+            return []
+        stmt = (
+            insert_for(self.session, UserModel)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[UserModel.email], index_where=_LIVE)
+            .returning(UserModel)
+        )
+        result = await self.session.scalars(stmt)
+        return list(result.all())
+
+    async def _get_many(self, column, keys: list, array_type) -> List[UserModel]:
+        users = []
+        for start in range(0, len(keys), BATCH_LOOKUP_CHUNK):
+            chunk = keys[start:start + BATCH_LOOKUP_CHUNK]
+            if dialect_name(self.session) == "postgresql":
+                # = ANY(array): one statement text for any chunk size, unlike IN (...)
+                condition = column == any_(bindparam("keys", chunk, type_=ARRAY(array_type)))
+            else:
+                condition = column.in_(chunk)
+            result = await self.session.execute(select(UserModel).where(condition, _LIVE))
+            users.extend(result.scalars().all())
+        return users
+
+    async def get_many_by_ids(self, uids: List[UUID]) -> List[UserModel]:
+        return await self._get_many(UserModel.id, uids, Uuid)
+
+    async def get_many_by_emails(self, emails: List[str]) -> List[UserModel]:
+        return await self._get_many(UserModel.email, emails, String)
+
     async def get_all(self) -> List[UserModel]:
-        stmt = select(UserModel)
+        stmt = select(UserModel).where(_LIVE)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def search(self, query: str, limit: int,
+                     after_score: Optional[float] = None,
+                     after_id: Optional[UUID] = None) -> List[Tuple[UserModel, float]]:
+        columns = (UserModel.email, UserModel.name, UserModel.surname)
+        matches = [column.icontains(query, autoescape=True) for column in columns]
+        if dialect_name(self.session) == "postgresql":
+            # Substring (ILIKE) and fuzzy (%) matches, both served by the pg_trgm GIN indexes
+            score = func.greatest(*(func.similarity(column, query) for column in columns))
+            matches += [column.op("%")(query) for column in columns]
+        else:
+            # no pg_trgm: substring match only, unranked
+            score = literal(1.0, Float)
+        score = score.label("score")
+        stmt = select(UserModel, score).where(or_(*matches), _LIVE)
+        if after_score is not None and after_id is not None:
+            # keyset paging over (score DESC, id ASC)
+            stmt = stmt.where(or_(score < after_score,
+                                  and_(score == after_score, UserModel.id > after_id)))
+        stmt = stmt.order_by(score.desc(), UserModel.id).limit(limit)
+        result = await self.session.execute(stmt)
+        return [(user, user_score) for user, user_score in result.all()]
+
     async def update(self, user: UserModel, update_data: dict) -> UserModel:
         try:
             for key, value in update_data.items():
@@ -66,18 +140,126 @@ class UserRepository(BaseRepository[UserModel]):
             await self.session.rollback()
             raise DataBaseError(f"Failed to update user: {str(e)}")
 
+    async def get_principal_row(self, uid: UUID) -> Optional[Tuple[UUID, UserRole, bool, int]]:
+        """Only the columns the auth path needs"""
+        result = await self.session.execute(_PRINCIPAL_BY_ID, {"uid": uid})
+        return result.first()
+
     async def get_user_role(self, uid: UUID) -> Optional[str]:
-        stmt = select(UserModel.role).where(UserModel.id == uid)
+        result = await self.session.execute(_ROLE_BY_ID, {"uid": uid})
+        return result.scalars().first()
+
+    async def bump_token_version(self, uid: UUID) -> Optional[int]:
+        """Invalidates every token issued with the current version"""
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == uid, _LIVE)
+            .values(token_version=UserModel.token_version + 1)
+            .returning(UserModel.token_version)
+            .execution_options(synchronize_session=False)
+        )
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
-    async def delete_old_unverified(self, days: int = 2) -> int:
+    async def apply_activity(self, rows: List[Tuple[UUID, Optional[datetime], datetime, int]]) -> int:
+        """Bulk UPDATE ... FROM (VALUES ...) of (id, last_login_at, last_seen_at, logins) rows"""
+        if not rows:
+            return 0
+        if dialect_name(self.session) != "postgresql":
+            return await self._apply_activity_executemany(rows)
+        activity = values(
+            column("id", Uuid),
+            column("last_login_at", DateTime(timezone=True)),
+            column("last_seen_at", DateTime(timezone=True)),
+            column("logins", Integer),
+            name="activity"
+        ).data(rows)
+        # cast: a column of only NULLs would otherwise be typed as text
+        last_login_at = cast(activity.c.last_login_at, DateTime(timezone=True))
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == activity.c.id)
+            .values(
+                last_login_at=func.coalesce(last_login_at, UserModel.last_login_at),
+                last_seen_at=activity.c.last_seen_at,
+                login_count=UserModel.login_count + activity.c.logins,
+                updated_at=UserModel.updated_at  # activity is not a profile update
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
+
+    async def _apply_activity_executemany(self, rows) -> int:
+        # portable fallback, sqlite has no column aliases on a VALUES subquery
+        table = UserModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("uid"))
+            .values(
+                last_login_at=func.coalesce(bindparam("login_at", type_=DateTime(timezone=True)),
+                                            table.c.last_login_at),
+                last_seen_at=bindparam("seen_at"),
+                login_count=table.c.login_count + bindparam("logins"),
+                updated_at=table.c.updated_at
+            )
+        )
+        await self.session.execute(stmt, [
+            {"uid": uid, "login_at": login_at, "seen_at": seen_at, "logins": logins}
+            for uid, login_at, seen_at, logins in rows
+        ])
+        return len(rows)
+
+    async def delete_old_unverified(self, days: int = 2) -> List[UserRole]:
+        """Returns roles of deleted users, so callers can adjust counters"""
         two_days_ago = datetime.utcnow() - timedelta(days=2)
         stmt = (
             delete(UserModel).where(
                 UserModel.is_verified == False,
-                UserModel.created_at < two_days_ago
-            ).execution_options(synchronize_session=False)
+                UserModel.created_at < two_days_ago,
+                _LIVE  # soft deleted users were already taken off the counters
+            ).returning(UserModel.role).execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def soft_delete(self, uid: UUID) -> Optional[Tuple[UserRole, bool, str]]:
+        """Marks the user deleted in one indexed UPDATE; (role, is_verified, email)
+        of the user, or None if there is no live user with this id"""
+        now = datetime.now(UTC)
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == uid, _LIVE)
+            .values(deleted_at=now, updated_at=now)
+            .returning(UserModel.role, UserModel.is_verified, UserModel.email)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.first()
+
+    async def get_deleted_ids(self, deleted_before: datetime, limit: int) -> List[UUID]:
+        """A batch for the purge task, served by the partial index on deleted_at"""
+        stmt = (
+            select(UserModel.id)
+            .where(UserModel.deleted_at.is_not(None), UserModel.deleted_at < deleted_before)
+            .order_by(UserModel.deleted_at)
+            .limit(limit)
+        )
+        if dialect_name(self.session) == "postgresql":
+            # concurrent purge runs take different batches instead of waiting on each other
+            stmt = stmt.with_for_update(skip_locked=True)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_deleted(self) -> int:
+        stmt = select(func.count()).select_from(UserModel).where(UserModel.deleted_at.is_not(None))
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def purge(self, uids: List[UUID]) -> int:
+        stmt = (
+            delete(UserModel)
+            .where(UserModel.id.in_(uids), UserModel.deleted_at.is_not(None))
+            .execution_options(synchronize_session=False)
         )
         result = await self.session.execute(stmt)
         return result.rowcount or 0
@@ -0,0 +1,89 @@
+from datetime import date
+from typing import Dict, List, Tuple
+from sqlalchemy import select, func, type_coerce, Date
+from app.db.database import dialect_name, insert_for
+from app.db.User import UserModel, UserRole
+from app.db.UserStats import UserCounterModel, UserSignupDailyModel
+
+
+def user_deltas(role: UserRole, is_verified: bool, n: int = 1) -> Dict[str, int]:
+    """Counter changes for adding n users (negative n removes them)"""
+    return {
+        "total": n,
+        f"role:{UserRole(role).value}": n,
+        "verified" if is_verified else "unverified": n,
+    }
+
+
+class UserStatsRepository:
+    def __init__(self, session):
+        self.session = session
+
+    async def increment(self, deltas: Dict[str, int]) -> None:
+        # sorted: rows are locked in VALUES order, a fixed order cannot deadlock
+        rows = [{"name": name, "value": delta} for name, delta in sorted(deltas.items()) if delta]
+        if not rows:
+            return
+        stmt = insert_for(self.session, UserCounterModel).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserCounterModel.name],
+            set_={"value": UserCounterModel.value + stmt.excluded.value}
+        )
+        await self.session.execute(stmt)
+
+    async def increment_signups(self, day: date, count: int = 1) -> None:
+        stmt = insert_for(self.session, UserSignupDailyModel).values(day=day, count=count)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserSignupDailyModel.day],
+            set_={"count": UserSignupDailyModel.count + stmt.excluded.count}
+        )
+        await self.session.execute(stmt)
+
+    async def get_counters(self) -> Dict[str, int]:
+        result = await self.session.execute(select(UserCounterModel.name, UserCounterModel.value))
+        return dict(result.all())
+
+    async def get_signups(self, since: date) -> List[Tuple[date, int]]:
+        stmt = (
+            select(UserSignupDailyModel.day, UserSignupDailyModel.count)
+            .where(UserSignupDailyModel.day >= since)
+            .order_by(UserSignupDailyModel.day)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def reconcile(self) -> Dict[str, int]:
+        """Recompute all counters from users_table (full scan, for the periodic task only)"""
+        # lock the counters first (same name order as increment): a signup or delete
+        # committing between the count and the write would otherwise be overwritten
+        await self.session.execute(
+            select(UserCounterModel.name).order_by(UserCounterModel.name).with_for_update()
+        )
+        counters = {"total": 0, "verified": 0, "unverified": 0}
+        counters.update({f"role:{role.value}": 0 for role in UserRole})
+        # soft deleted users are off the counters already, still counted as signups below
+        stmt = select(UserModel.role, UserModel.is_verified, func.count()).where(
+            UserModel.deleted_at.is_(None)
+        ).group_by(UserModel.role, UserModel.is_verified)
+        for role, is_verified, count in (await self.session.execute(stmt)).all():
+            for name, delta in user_deltas(role, is_verified, count).items():
+                counters[name] += delta
+
+        stmt = insert_for(self.session, UserCounterModel).values([{"name": k, "value": v} for k, v in sorted(counters.items())])
+        await self.session.execute(stmt.on_conflict_do_update(
+            index_elements=[UserCounterModel.name],
+            set_={"value": stmt.excluded.value}
+        ))
+
+        signup_day = type_coerce(func.date(UserModel.created_at), Date)
+        stmt = select(signup_day, func.count()).group_by(signup_day)
+        days = [{"day": day, "count": count} for day, count in (await self.session.execute(stmt)).all()]
+        if days:
+            # greatest: only repair missed increments, deleted users stay counted as signups
+            greatest = func.greatest if dialect_name(self.session) == "postgresql" else func.max
+            stmt = insert_for(self.session, UserSignupDailyModel).values(days)
+            await self.session.execute(stmt.on_conflict_do_update(
+                index_elements=[UserSignupDailyModel.day],
+                set_={"count": greatest(UserSignupDailyModel.count, stmt.excluded.count)}
+            ))
+        return counters
@@ -0,0 +1,30 @@
+import uuid
+from datetime import datetime
+from typing import Optional, List
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AuditEventSchema(BaseModel):
+    id: int
+    event_type: str
+    user_id: Optional[uuid.UUID]
+    actor_id: Optional[uuid.UUID]
+    data: Optional[dict]
+    created_at: datetime
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AuditEventPage(BaseModel):
+    items: List[AuditEventSchema]
+    next_cursor: Optional[str] = None
+
+
+class AuditMetricsSchema(BaseModel):
+    emitted: int
+    dropped: int
+    flushed: int
+    flushes: int
+    failed_flushes: int
+    last_flush_ms: float
+    queue_depth: int
@@ -1,8 +1,9 @@
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, date
+from typing import Optional, List, Dict
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, model_validator
+from app.core.config import BATCH_LOOKUP_MAX
 from app.db.User import UserRole
 
 
@@ -20,6 +21,45 @@ class UserReadSchema(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserSearchResult(UserReadSchema):
+    score: float
+
+
+class UserSearchPage(BaseModel):
+    items: List[UserSearchResult]
+    next_cursor: Optional[str] = None
+
+
+class DailySignups(BaseModel):
+    day: date
+    count: int
+
+
+class UserStatsSchema(BaseModel):
+    total: int
+    verified: int
+    unverified: int
+    by_role: Dict[str, int]
+    signups_per_day: List[DailySignups]
+
+
+class UserBatchLookup(BaseModel):
+    ids: List[uuid.UUID] = Field(default_factory=list)
+    emails: List[EmailStr] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def check_size(self):
+        if len(self.ids) + len(self.emails) > BATCH_LOOKUP_MAX:
+            raise ValueError(f"At most {BATCH_LOOKUP_MAX} ids and emails per request")
+        return self
+
+
+class UserBatchResult(BaseModel):
+    users: List[UserReadSchema]
+    missing_ids: List[uuid.UUID]
+    missing_emails: List[str]
+
+
 class UserUpdate(BaseModel):
     name: Optional[str]
     surname: Optional[str]
@@ -33,3 +73,7 @@ class UserCreate(UserBase):
 class UserSignIn(BaseModel):
     email: EmailStr
     password: str = Field(min_length=8)
+
+
+class ResendVerification(BaseModel):
+    email: EmailStr
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from app.core.audit import audit_log
+from app.core.unit_of_work import UnitOfWork
+from app.db.User import UserRole
+from app.schemas.AuditSchema import AuditEventPage, AuditEventSchema, AuditMetricsSchema
+from app.services.Exceptions import PermissionDenied, InvalidCursor
+from app.utils.cursor import encode_cursor, decode_cursor
+
+
+class AuditService:
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def get_user_events(self, user_id: UUID, role: str, limit: int = 50,
+                              cursor: Optional[str] = None) -> AuditEventPage:
+        if role != UserRole.ADMIN:
+            raise PermissionDenied("Only Admin can view")
+        before_created_at, before_id = None, None
+        if cursor:
+            try:
+                created_at, event_id = decode_cursor(cursor, 2)
+                before_created_at, before_id = datetime.fromisoformat(created_at), int(event_id)
+            except ValueError:
+                raise InvalidCursor("Invalid cursor")
+        async with self.uow() as uow:
+            events = await uow.audit.get_by_user(user_id, limit,
+                                                 before_created_at=before_created_at,
+                                                 before_id=before_id)
+        next_cursor = None
+        if len(events) == limit:
+            next_cursor = encode_cursor(events[-1].created_at.isoformat(), events[-1].id)
+        return AuditEventPage(items=[AuditEventSchema.model_validate(e) for e in events],
+                              next_cursor=next_cursor)
+
+    @staticmethod
+    def get_metrics(role: str) -> AuditMetricsSchema:
+        if role != UserRole.ADMIN:
+            raise PermissionDenied("Only Admin can view")
+        return AuditMetricsSchema(**audit_log.snapshot())
@@ -1,5 +1,6 @@
+import logging
+from typing import Optional
 from uuid import UUID
-import asyncio
 from app.schemas.UserSchema import UserCreate, UserSignIn, UserReadSchema
 from app.core.security import (
     verify_password,
@@ -18,6 +19,16 @@ from app.services.Exceptions import (
 from app.services.UserService import UserService
 from app.services.EmailService import EmailService
 from app.core.unit_of_work import UnitOfWork
+from app.utils import background
+from app.core.audit import audit_log
+from app.core.activity import activity_buffer
+from app.core.principal import Principal
+from app.core.rate_store import rate_store
+from app.core.revocation import revocations
+from app.core.config import RESEND_COOLDOWN_SECONDS, RESEND_DAILY_CAP
+
+
+logger = logging.getLogger(__name__)
 
 
 class AuthService:
@@ -39,18 +50,40 @@ class AuthService:
                 raise UserAlreadyVerifiedException("User already verified")
 
             updated_user = await uow.users.update(user, {"is_verified": True})
-            return UserReadSchema.model_validate(updated_user)
+            await uow.stats.increment({"verified": 1, "unverified": -1})
+        audit_log.emit("verify", user_id=updated_user.id)
+        return UserReadSchema.model_validate(updated_user)
+
+    @staticmethod
+    def _access_payload(access_token: str) -> tuple[UUID, int]:
+        payload = decode_token(access_token, expected_type="access")
+        if not payload or "sub" not in payload:
+            raise InvalidTokenException("Invalid token")
+        return UUID(payload["sub"]), payload.get("ver", 0)
 
-    async def get_current_user(self, access_token: str) -> UserReadSchema:
+    async def get_current_user(self, access_token: str) -> Principal:
+        uid, token_version = self._access_payload(access_token)
+        async with self.uow() as uow:
+            row = await uow.users.get_principal_row(uid)
+        if not row:
+            raise UserNotFoundError("User not found")
+        principal = Principal(*row)
+        if principal.token_version != token_version:
+            raise InvalidTokenException("Token revoked")
+        activity_buffer.record_seen(principal.id)
+        return principal
+
+    async def get_current_user_profile(self, access_token: str) -> UserReadSchema:
+        """Full profile for endpoints that return it, one query like get_current_user"""
+        uid, token_version = self._access_payload(access_token)
         async with self.uow() as uow:
-            payload = decode_token(access_token, expected_type="access")
-            if not payload or "sub" not in payload:
-                raise InvalidTokenException("Invalid token")
-            uid = UUID(payload.get("sub"))
             user = await uow.users.get_by_id(uid=uid)
-            if not user:
-                raise UserNotFoundError("User not found")
-            return UserReadSchema.model_validate(user)
+        if not user:
+            raise UserNotFoundError("User not found")
+        if user.token_version != token_version:
+            raise InvalidTokenException("Token revoked")
+        activity_buffer.record_seen(user.id)
+        return UserReadSchema.model_validate(user)
 
     async def signup(self, user_in: UserCreate):
         email_service = EmailService()
@@ -58,9 +91,29 @@ class AuthService:
             new_user = await self.user_service.add_user(user=user_in)
         except UserAlreadyExistError:
             raise UserAlreadyExistError("User already exist")
-        asyncio.create_task(email_service.send_verification_email(new_user.email))
+        background.spawn(email_service.send_verification_email(new_user.email))
+        audit_log.emit("signup", user_id=new_user.id)
         return new_user
 
+    def resend_verification(self, email: str) -> None:
+        """Schedules the resend and returns at once: the caller learns nothing about
+        the address and the response time does not depend on it"""
+        key = email.lower()
+        background.spawn_once(f"resend:{key}", self._resend_verification(email, key))
+
+    async def _resend_verification(self, email: str, key: str) -> None:
+        # cooldown / cap checks hit the shared store only, storms never reach DB or SMTP
+        if not await rate_store.claim(f"resend:cooldown:{key}", RESEND_COOLDOWN_SECONDS):
+            return
+        if await rate_store.incr(f"resend:daily:{key}", 60 * 60 * 24) > RESEND_DAILY_CAP:
+            logger.info("Daily resend cap reached for %s", key)
+            return
+        async with self.uow() as uow:
+            user = await uow.users.get_by_email(email=email)
+        if not user or user.is_verified:
+            return
+        await EmailService().send_verification_email(user.email)
+
     async def signin(self, user_data: UserSignIn):
         async with self.uow() as uow:
             user = await uow.users.get_by_email(email=user_data.email)
@@ -71,19 +124,44 @@ class AuthService:
             if not await verify_password(user_data.password,
                                          user.password_hash):
                 raise InvalidCredentials("Invalid credentials")
-            access_token = create_access_token({"sub": str(user.id)})
-            refresh_token = create_refresh_token({"sub": str(user.id)})
-            return {"access_token": access_token,
-                    "refresh_token": refresh_token}
+        claims = {"sub": str(user.id), "ver": user.token_version}
+        access_token = create_access_token(claims)
+        refresh_token = create_refresh_token(claims)
+        audit_log.emit("login", user_id=user.id)
+        activity_buffer.record_login(user.id)
+        return {"access_token": access_token,
+                "refresh_token": refresh_token}
+
+    async def logout(self, access_token: Optional[str], refresh_token: Optional[str]) -> None:
+        """Revokes the presented tokens; missing, invalid or expired ones are ignored"""
+        user_id = None
+        for token, token_type in ((access_token, "access"), (refresh_token, "refresh")):
+            payload = decode_token(token, expected_type=token_type) if token else None
+            if payload and "jti" in payload:
+                await revocations.revoke(payload["jti"], payload["exp"])
+                user_id = payload.get("sub")
+        if user_id is not None:
+            audit_log.emit("logout", user_id=UUID(user_id))
+
+    async def revoke_all(self, principal: Principal) -> None:
+        """Logs the user out everywhere: the version bump is the durable record,
+        the revocation list rejects the old tokens before they reach the database"""
+        async with self.uow() as uow:
+            await uow.users.bump_token_version(principal.id)
+        await revocations.revoke_user(str(principal.id))
+        audit_log.emit("revoke_all", user_id=principal.id)
 
     async def refresh_token(self, refresh_token: str):
         payload = decode_token(refresh_token, expected_type="refresh")
         if not payload:
             return None
         async with self.uow() as uow:
-            user = await uow.users.get_by_id(payload["sub"])
-            if user is not None:
-                new_access_token = create_access_token(data={"sub": payload["sub"]})
-                return new_access_token
-            else:
+            row = await uow.users.get_principal_row(UUID(payload["sub"]))
+            if row is None:
                 raise UserNotFoundError("User not found")
+            principal = Principal(*row)
+            if principal.token_version != payload.get("ver", 0):
+                return None
+            new_access_token = create_access_token(data={"sub": payload["sub"],
+                                                         "ver": principal.token_version})
+            return new_access_token
@@ -23,4 +23,8 @@ class DataBaseError(Exception):
     pass
 
 class InvalidCredentials(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class InvalidCursor(Exception):
+    pass
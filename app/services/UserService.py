@@ -1,11 +1,43 @@
-from typing import List
+import logging
+import time
+from collections import Counter
+from datetime import datetime, timedelta, UTC
+from typing import List, Optional, Tuple
 from uuid import UUID
-from app.schemas.UserSchema import UserCreate, UserReadSchema, UserUpdate, UserRole
-from app.core.security import hash_password
+from app.schemas.UserSchema import (
+    UserCreate,
+    UserReadSchema,
+    UserUpdate,
+    UserRole,
+    UserSearchPage,
+    UserSearchResult,
+    UserStatsSchema,
+    DailySignups,
+    UserBatchLookup,
+    UserBatchResult
+)
+from app.core.security import hash_password, hash_password_async
+from app.core.config import SIGNUP_GROUP_COMMIT
 from app.core.unit_of_work import UnitOfWork
+from app.core.audit import audit_log
+from app.core.principal import Principal
+from app.core.revocation import revocations
 from app.db.User import UserModel
+from app.repositories.UserStatsRepo import user_deltas
+from app.repositories.SignupWriter import signup_writer
+from app.utils.cursor import encode_cursor, decode_cursor
 from app.services.Exceptions import *
 
+logger = logging.getLogger(__name__)
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[float, UUID]:
+    try:
+        score, uid = decode_cursor(cursor, 2)
+        return float(score), UUID(uid)
+    except ValueError:
+        raise InvalidCursor("Invalid cursor")
+
 
 class UserService:
     def __init__(self, uow: UnitOfWork):
@@ -19,6 +51,8 @@ class UserService:
             return UserReadSchema.model_validate(user)
 
     async def add_user(self, user: UserCreate) -> UserReadSchema:
+        if SIGNUP_GROUP_COMMIT:
+            return await self._add_user_batched(user)
         async with self.uow() as uow:
             existing_user = await uow.users.get_by_email(email=user.email)
             if existing_user:
@@ -36,8 +70,27 @@ class UserService:
                 role=user.role
             )
             user_entity = await uow.users.add(new_user)
+            await uow.stats.increment(user_deltas(user_entity.role, False))
+            await uow.stats.increment_signups(datetime.now(UTC).date())
             return UserReadSchema.model_validate(user_entity)
 
+    async def _add_user_batched(self, user: UserCreate) -> UserReadSchema:
+        # no existence check round trip, ON CONFLICT in the batch INSERT decides
+        try:
+            hashed_pass = await hash_password_async(user.password)
+        except ValueError as e:
+            raise ValueError(f"Password error {str(e)}")
+        user_entity = await signup_writer.submit({
+            "email": user.email,
+            "name": user.name,
+            "surname": user.surname,
+            "password_hash": hashed_pass,
+            "role": user.role,
+        })
+        if user_entity is None:
+            raise UserAlreadyExistError("User already exist")
+        return UserReadSchema.model_validate(user_entity)
+
     async def get_all_users(self, role: str) -> List[UserReadSchema]:
         if role != UserRole.ADMIN:
             raise PermissionDenied("Only Admin can view")
@@ -47,6 +100,22 @@ class UserService:
                 raise UserNotFoundError("Users not found")
             return [UserReadSchema.model_validate(user) for user in users]
 
+    async def search_users(self, query: str, role: str, limit: int = 20,
+                           cursor: Optional[str] = None) -> UserSearchPage:
+        if role != UserRole.ADMIN:
+            raise PermissionDenied("Only Admin can view")
+        after_score, after_id = _decode_search_cursor(cursor) if cursor else (None, None)
+        async with self.uow() as uow:
+            rows = await uow.users.search(query, limit, after_score=after_score, after_id=after_id)
+        items = [UserSearchResult(score=score, **UserReadSchema.model_validate(user).model_dump())
+                 for user, score in rows]
+        next_cursor = None
+        if len(rows) == limit:
+            last_user, last_score = rows[-1]
+            # repr keeps the exact float, so the keyset comparison matches the row again
+            next_cursor = encode_cursor(repr(last_score), last_user.id)
+        return UserSearchPage(items=items, next_cursor=next_cursor)
+
     async def get_user_by_id(self, user_id: str, role: str) -> UserReadSchema:
         if role != UserRole.ADMIN:
             raise PermissionDenied("Only Admin can view")
@@ -56,19 +125,49 @@ class UserService:
                 raise UserNotFoundError("User not found")
             return UserReadSchema.model_validate(user)
 
-    async def delete_user_by_id(self, user_id: str, role: str) -> dict:
+    async def get_users_batch(self, lookup: UserBatchLookup, role: str) -> UserBatchResult:
         if role != UserRole.ADMIN:
             raise PermissionDenied("Only Admin can view")
+        ids = list(dict.fromkeys(lookup.ids))
+        emails = list(dict.fromkeys(lookup.emails))
         async with self.uow() as uow:
-            user = await uow.users.get_by_id(uid=UUID(user_id))
-            if not user:
+            by_id = {user.id: user for user in await uow.users.get_many_by_ids(ids)} if ids else {}
+            by_email = {user.email: user for user in await uow.users.get_many_by_emails(emails)} if emails else {}
+        found = {**by_id, **{user.id: user for user in by_email.values()}}
+        return UserBatchResult(
+            users=[UserReadSchema.model_validate(user) for user in found.values()],
+            missing_ids=[uid for uid in ids if uid not in by_id],
+            missing_emails=[email for email in emails if email not in by_email]
+        )
+
+    async def delete_user_by_id(self, user_id: str, role: str,
+                                actor_id: Optional[UUID] = None) -> dict:
+        if role != UserRole.ADMIN:
+            raise PermissionDenied("Only Admin can view")
+        uid = UUID(user_id)
+        # soft delete: one UPDATE, the row and its dependents are purged by a Celery task
+        async with self.uow() as uow:
+            deleted = await uow.users.soft_delete(uid)
+            if not deleted:
                 raise UserNotFoundError("User not found")
-            await uow.users.delete(user)
-            return {"msg": f"User: {user.id} successfully deleted"}
+            deleted_role, is_verified, email = deleted
+            await uow.stats.increment(user_deltas(deleted_role, is_verified, -1))
+            # written with the soft delete, not through the buffered audit log:
+            # with no grace period the purge may remove the row before a flush
+            await uow.audit.add_many([{
+                "event_type": "delete",
+                "user_id": uid,
+                "actor_id": actor_id,
+                "data": {"email": email},
+                "created_at": datetime.now(UTC),
+            }])
+        # revoke only after commit
+        await revocations.revoke_user(str(uid))
+        return {"msg": f"User: {uid} successfully deleted"}
 
     async def update_user_by_id(self, user_id_to_change: str,
                                 update_data: UserUpdate,
-                                owner: UserReadSchema) -> UserReadSchema:
+                                owner: Principal) -> UserReadSchema:
         async with self.uow() as uow:
             target_user = await uow.users.get_by_id(UUID(user_id_to_change))
 
@@ -80,10 +179,75 @@ class UserService:
             update_fields = update_data.model_dump(exclude_unset=True, exclude_none=True)
             if owner.role != UserRole.ADMIN and "role" in update_fields:
                 update_fields.pop("role")
+            old_role = target_user.role
             updated_user = await uow.users.update(target_user, update_fields)
-            return UserReadSchema.model_validate(updated_user)
+            if updated_user.role != old_role:
+                await uow.stats.increment({f"role:{UserRole(old_role).value}": -1,
+                                           f"role:{UserRole(updated_user.role).value}": 1})
+        audit_log.emit("profile_update", user_id=updated_user.id, actor_id=owner.id,
+                       fields=sorted(update_fields))
+        if updated_user.role != old_role:
+            audit_log.emit("role_change", user_id=updated_user.id, actor_id=owner.id,
+                           old_role=UserRole(old_role).value, new_role=UserRole(updated_user.role).value)
+        return UserReadSchema.model_validate(updated_user)
 
     async def delete_unverified_users(self):
         async with self.uow() as uow:
-            deleted_count = await uow.users.delete_old_unverified()
-            return deleted_count
+            deleted_roles = await uow.users.delete_old_unverified()
+            deltas = Counter()
+            for role, count in Counter(deleted_roles).items():
+                deltas.update(user_deltas(role, False, -count))
+            await uow.stats.increment(deltas)
+            return len(deleted_roles)
+
+    async def purge_deleted_users(self, batch_size: int, max_batches: int,
+                                  grace_seconds: int = 0) -> dict:
+        """Hard-deletes soft deleted users and their audit events, one short
+        transaction per batch so no lock is held for long"""
+        deleted_before = datetime.now(UTC) - timedelta(seconds=grace_seconds)
+        progress = {"batches": 0, "users": 0, "audit_events": 0}
+        started = time.perf_counter()
+        for _ in range(max_batches):
+            async with self.uow() as uow:
+                uids = await uow.users.get_deleted_ids(deleted_before, batch_size)
+                if not uids:
+                    break
+                progress["audit_events"] += await uow.audit.delete_by_users(uids)
+                progress["users"] += await uow.users.purge(uids)
+                # the users' own events are gone, keep a record of the purge itself
+                await uow.audit.add_many([{
+                    "event_type": "purge",
+                    "user_id": None,
+                    "actor_id": None,
+                    "data": {"user_ids": [str(uid) for uid in uids]},
+                    "created_at": datetime.now(UTC),
+                }])
+            progress["batches"] += 1
+            logger.info("Purge batch %d: %d users, total %d users / %d audit events, %.0f ms",
+                        progress["batches"], len(uids), progress["users"], progress["audit_events"],
+                        (time.perf_counter() - started) * 1000)
+            if len(uids) < batch_size:
+                break
+        async with self.uow() as uow:
+            progress["remaining"] = await uow.users.count_deleted()
+        progress["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return progress
+
+    async def get_stats(self, role: str, days: int = 30) -> UserStatsSchema:
+        if role != UserRole.ADMIN:
+            raise PermissionDenied("Only Admin can view")
+        since = datetime.now(UTC).date() - timedelta(days=days - 1)
+        async with self.uow() as uow:
+            counters = await uow.stats.get_counters()
+            signups = await uow.stats.get_signups(since)
+        return UserStatsSchema(
+            total=counters.get("total", 0),
+            verified=counters.get("verified", 0),
+            unverified=counters.get("unverified", 0),
+            by_role={r.value: counters.get(f"role:{r.value}", 0) for r in UserRole},
+            signups_per_day=[DailySignups(day=day, count=count) for day, count in signups]
+        )
+
+    async def reconcile_stats(self) -> dict:
+        async with self.uow() as uow:
+            return await uow.stats.reconcile()
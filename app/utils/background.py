@@ -0,0 +1,52 @@
+import asyncio
+import logging
+from typing import Coroutine, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Strong references to fire-and-forget tasks (verification emails etc.),
+# so they are not garbage collected mid-flight and can be drained on shutdown
+_tasks: Set[asyncio.Task] = set()
+# key -> running task, for spawn_once
+_keyed: Dict[str, asyncio.Task] = {}
+
+
+def spawn(coro: Coroutine) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _tasks.add(task)
+    task.add_done_callback(_on_done)
+    return task
+
+
+def spawn_once(key: str, coro: Coroutine) -> Optional[asyncio.Task]:
+    """Like spawn, but collapses concurrent calls with the same key into the running task"""
+    if key in _keyed:
+        coro.close()
+        return None
+    task = _keyed[key] = spawn(coro)
+    task.add_done_callback(lambda _: _keyed.pop(key, None))
+    return task
+
+
+def pending() -> int:
+    return len(_tasks)
+
+
+def _on_done(task: asyncio.Task) -> None:
+    _tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task failed", exc_info=task.exception())
+
+
+async def drain(timeout: float) -> int:
+    """Wait up to `timeout` seconds for background tasks, cancel the rest.
+    Returns number of tasks that had to be cancelled."""
+    if not _tasks:
+        return 0
+    _, still_running = await asyncio.wait(set(_tasks), timeout=timeout)
+    for task in still_running:
+        task.cancel()
+    if still_running:
+        await asyncio.gather(*still_running, return_exceptions=True)
+        logger.warning("Cancelled %d background tasks on shutdown", len(still_running))
+    return len(still_running)
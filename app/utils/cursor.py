@@ -0,0 +1,15 @@
+import base64
+from typing import List
+
+
+# Opaque keyset cursors for paginated endpoints
+def encode_cursor(*parts) -> str:
+    return base64.urlsafe_b64encode("|".join(str(part) for part in parts).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[str]:
+    """Raises ValueError on malformed cursor"""
+    parts = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    if len(parts) != size:
+        raise ValueError("Malformed cursor")
+    return parts
@@ -1,18 +1,36 @@
 from datetime import timedelta
 
 from celery import Celery
+from app.core.config import (
+    REDIS_URL,
+    CELERY_RESULT_BACKEND,
+    CLEANUP_UNVERIFIED_INTERVAL,
+    STATS_RECONCILE_INTERVAL,
+    PURGE_DELETED_INTERVAL,
+)
 
 celery_app = Celery(
     "coffee_shop",
-    broker="redis://redis:6379/0",
-    backend="redis://redis:6379/1",
-    include=["app.workers.tasks.user_cleanup"]
+    broker=REDIS_URL,
+    backend=CELERY_RESULT_BACKEND,
+    include=["app.workers.tasks.user_cleanup",
+             "app.workers.tasks.user_stats"]
 )
 
 celery_app.conf.timezone = "UTC"
+# Each maintenance task is also guarded by a lease (app.workers.locks.single_flight),
+# so overlapping beat ticks, replicas or manual triggers never run it twice at once
 celery_app.conf.beat_schedule = {
     "delete_unverified_users_daily": {
         "task": "app.workers.tasks.user_cleanup.delete_unverified_users",
-        "schedule": timedelta(days=1),
+        "schedule": timedelta(seconds=CLEANUP_UNVERIFIED_INTERVAL),
+    },
+    "reconcile_user_stats_hourly": {
+        "task": "app.workers.tasks.user_stats.reconcile_user_stats",
+        "schedule": timedelta(seconds=STATS_RECONCILE_INTERVAL),
+    },
+    "purge_deleted_users": {
+        "task": "app.workers.tasks.user_cleanup.purge_deleted_users",
+        "schedule": timedelta(seconds=PURGE_DELETED_INTERVAL),
     },
 }
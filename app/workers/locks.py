@@ -0,0 +1,108 @@
+import functools
+import logging
+import threading
+import time
+import uuid
+from typing import Callable, Optional
+import redis
+from app.core.config import REDIS_URL, TASK_LOCK_TTL
+
+logger = logging.getLogger(__name__)
+
+
+def get_redis() -> redis.Redis:
+    return redis.Redis.from_url(REDIS_URL)
+
+
+class LeaseLock:
+    """Redis lease: SET NX PX with a unique token, renewed and released only by its owner.
+    Compare-and-set goes through WATCH/MULTI instead of Lua, so it also runs on fakeredis."""
+
+    def __init__(self, client: redis.Redis, name: str, ttl: float):
+        self.client = client
+        self.key = f"lock:{name}"
+        self.ttl_ms = int(ttl * 1000)
+        self.token = uuid.uuid4().hex.encode()
+
+    def acquire(self) -> bool:
+        return bool(self.client.set(self.key, self.token, nx=True, px=self.ttl_ms))
+
+    def _if_owner(self, action: Callable) -> bool:
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(self.key)
+                if pipe.get(self.key) != self.token:
+                    pipe.unwatch()
+                    return False
+                pipe.multi()
+                action(pipe)
+                pipe.execute()
+                return True
+            except redis.WatchError:
+                return False
+
+    def renew(self) -> bool:
+        return self._if_owner(lambda pipe: pipe.pexpire(self.key, self.ttl_ms))
+
+    def release(self) -> bool:
+        return self._if_owner(lambda pipe: pipe.delete(self.key))
+
+
+def _heartbeat(lock: LeaseLock, interval: float, stop: threading.Event,
+               retry_interval: float = 1.0) -> None:
+    renewed_at = time.monotonic()
+    wait = interval
+    while not stop.wait(wait):
+        try:
+            renewed = lock.renew()
+        except redis.RedisError as e:
+            # a Redis blip: keep retrying while the lease is still alive
+            if time.monotonic() - renewed_at >= lock.ttl_ms / 1000:
+                logger.error("Lease %s lapsed while Redis was unreachable, another run may start: %s",
+                             lock.key, e)
+                return
+            logger.warning("Renewing lease %s failed, retrying: %s", lock.key, e)
+            wait = min(retry_interval, interval)
+            continue
+        if not renewed:
+            # can't stop the task safely from here, make it visible at least
+            logger.warning("Lost lease %s, another run may start", lock.key)
+            return
+        renewed_at = time.monotonic()
+        wait = interval
+
+
+def single_flight(name: Optional[str] = None, ttl: float = TASK_LOCK_TTL,
+                  heartbeat: Optional[float] = None,
+                  client_factory: Callable[[], redis.Redis] = get_redis):
+    """Run the wrapped task at most once at a time across all workers / beat replicas.
+    If the lease is held elsewhere the call is skipped and returns None."""
+
+    def decorator(func):
+        lock_name = name or f"{func.__module__}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            lock = LeaseLock(client_factory(), lock_name, ttl)
+            if not lock.acquire():
+                logger.info("Skipping %s, already running elsewhere", lock_name)
+                return None
+            stop = threading.Event()
+            renewer = threading.Thread(target=_heartbeat, args=(lock, heartbeat or ttl / 3, stop),
+                                       daemon=True)
+            renewer.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stop.set()
+                renewer.join()
+                try:
+                    lock.release()
+                except redis.RedisError as e:
+                    # the run itself is done, the TTL frees the lease
+                    logger.warning("Releasing lease %s failed, it expires in %d ms: %s",
+                                   lock.key, lock.ttl_ms, e)
+
+        return wrapper
+
+    return decorator
@@ -1,9 +1,13 @@
 from app.workers.celery_app import celery_app
 from app.services.UserService import UserService
 from app.core.unit_of_work import UnitOfWork
+from app.db.database import engine
+from app.workers.locks import single_flight
+from app.core.config import PURGE_BATCH_SIZE, PURGE_MAX_BATCHES, PURGE_GRACE_SECONDS
 
 
 @celery_app.task(name="app.workers.tasks.user_cleanup.delete_unverified_users")
+@single_flight()
 def delete_unverified_users():
     import asyncio
     asyncio.run(_delete_old_users())
@@ -12,5 +16,27 @@ def delete_unverified_users():
 async def _delete_old_users():
     uow = UnitOfWork()
     service = UserService(uow)
-    deleted = await service.delete_unverified_users()
+    try:
+        deleted = await service.delete_unverified_users()
+    finally:
+        # pooled connections belong to this asyncio.run loop, the next task gets a new one
+        await engine.dispose()
     print(f"[Celery] Deleted {deleted} unverified users")
+
+
+@celery_app.task(name="app.workers.tasks.user_cleanup.purge_deleted_users")
+@single_flight()
+def purge_deleted_users():
+    import asyncio
+    return asyncio.run(_purge_deleted_users())
+
+
+async def _purge_deleted_users():
+    uow = UnitOfWork()
+    service = UserService(uow)
+    try:
+        progress = await service.purge_deleted_users(PURGE_BATCH_SIZE, PURGE_MAX_BATCHES, PURGE_GRACE_SECONDS)
+    finally:
+        await engine.dispose()
+    print(f"[Celery] Purged soft deleted users: {progress}")
+    return progress
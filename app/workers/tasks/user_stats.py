@@ -0,0 +1,23 @@
+from app.workers.celery_app import celery_app
+from app.services.UserService import UserService
+from app.core.unit_of_work import UnitOfWork
+from app.db.database import engine
+from app.workers.locks import single_flight
+
+
+@celery_app.task(name="app.workers.tasks.user_stats.reconcile_user_stats")
+@single_flight()
+def reconcile_user_stats():
+    import asyncio
+    asyncio.run(_reconcile_stats())
+
+
+async def _reconcile_stats():
+    uow = UnitOfWork()
+    service = UserService(uow)
+    try:
+        counters = await service.reconcile_stats()
+    finally:
+        # pooled connections belong to this asyncio.run loop, the next task gets a new one
+        await engine.dispose()
+    print(f"[Celery] Reconciled user stats: {counters}")
@@ -0,0 +1,91 @@
+"""Per-request cost of resolving the current user: full ORM row + UserReadSchema
+(the previous get_current_user) against get_principal_row + Principal
+
+    python -m benchmarks.principal_auth [--calls 2000]
+
+Runs on the in-memory database (DATABASE_URL=memory). For each variant reports
+time per call and the tracemalloc peak of one call, for the whole lookup and
+for building the returned object alone.
+"""
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("DATABASE_URL", "memory")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+
+from app.core.principal import Principal
+from app.core.security import hash_password
+from app.core.unit_of_work import UnitOfWork
+from app.db.User import UserModel, UserRole
+from app.db.database import create_schema, engine
+from app.schemas.UserSchema import UserReadSchema
+
+
+async def full_row(uow: UnitOfWork, uid):
+    async with uow() as u:
+        user = await u.users.get_by_id(uid=uid)
+    return UserReadSchema.model_validate(user)
+
+
+async def principal(uow: UnitOfWork, uid):
+    async with uow() as u:
+        row = await u.users.get_principal_row(uid)
+    return Principal(*row)
+
+
+async def measure_async(fn, calls: int) -> dict:
+    await fn()  # warm the statement caches
+    started = time.perf_counter()
+    for _ in range(calls):
+        await fn()
+    per_call_us = (time.perf_counter() - started) / calls * 1e6
+    peaks = []
+    for _ in range(min(calls, 200)):
+        tracemalloc.start()
+        await fn()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return {"us_per_call": round(per_call_us, 1), "peak_bytes": sorted(peaks)[len(peaks) // 2]}
+
+
+def measure_build(fn, calls: int) -> dict:
+    fn()
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    per_call_us = (time.perf_counter() - started) / calls * 1e6
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"us_per_call": round(per_call_us, 2), "peak_bytes": peak}
+
+
+async def main(calls: int) -> None:
+    await create_schema()
+    uow = UnitOfWork()
+    async with uow() as u:
+        user = await u.users.add(UserModel(email="bench@bench.example", name="bench", surname="user",
+                                           password_hash=hash_password("benchmark-password"),
+                                           role=UserRole.USER, is_verified=True))
+    async with uow() as u:
+        row = await u.users.get_principal_row(user.id)
+
+    results = {
+        "lookup  full row + UserReadSchema": await measure_async(lambda: full_row(uow, user.id), calls),
+        "lookup  principal row + Principal": await measure_async(lambda: principal(uow, user.id), calls),
+        "build   UserReadSchema.model_validate": measure_build(lambda: UserReadSchema.model_validate(user), calls * 10),
+        "build   Principal(*row)": measure_build(lambda: Principal(*row), calls * 10),
+    }
+    for name, result in results.items():
+        print(f"{name:<40} {result}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=2000)
+    asyncio.run(main(parser.parse_args().calls))
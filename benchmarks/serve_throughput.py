@@ -0,0 +1,103 @@
+"""Throughput of `python serve.py` against a single `uvicorn main:app` process
+
+    python benchmarks/serve_throughput.py [--seconds 10] [--concurrency 64] [--path /health/live]
+
+Both servers run on the in-memory database (DATABASE_URL=memory) with Redis
+switched off, so nothing but the serving setup differs. Requests go over real
+HTTP from an httpx client with `concurrency` parallel loops.
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENV = {
+    "DATABASE_URL": "memory",
+    "RATE_STORE": "memory",
+    "REVOCATION_SYNC": "memory",
+    "LOAD_SHEDDING_ENABLED": "false",
+    "QUERY_PROFILER_ENABLED": "false",
+    "JWT_SECRET_KEY": "benchmark",
+}
+
+
+async def wait_up(url: str, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url + "/health/live")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up")
+
+
+async def load(url: str, seconds: float, concurrency: int) -> dict:
+    latencies = []
+    errors = 0
+    deadline = time.monotonic() + seconds
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.get(url)
+                if response.status_code >= 500:
+                    errors += 1
+            except httpx.TransportError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    async with httpx.AsyncClient(limits=limits, timeout=10) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / seconds),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 2),
+        "errors": errors,
+    }
+
+
+def run(name: str, command: list, port: int, args) -> dict:
+    env = {**os.environ, **ENV, "PORT": str(port)}
+    server = subprocess.Popen(command, cwd=ROOT, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base = f"http://127.0.0.1:{port}"
+    try:
+        asyncio.run(wait_up(base))
+        result = asyncio.run(load(base + args.path, args.seconds, args.concurrency))
+    finally:
+        server.terminate()
+        server.wait()
+    print(f"{name:<28} {result}")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--path", default="/health/live")
+    args = parser.parse_args()
+
+    baseline = run("uvicorn main:app (1 proc)",
+                   [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", "8101"],
+                   8101, args)
+    served = run(f"serve.py ({os.environ.get('WEB_WORKERS') or os.cpu_count()} workers)",
+                 [sys.executable, "serve.py"], 8102, args)
+    print(f"speedup x{served['rps'] / max(1, baseline['rps']):.2f}")
+
+
+if __name__ == "__main__":
+    main()
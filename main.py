@@ -1,5 +1,67 @@
+import logging
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.api.router import main_router
+from app.core.activity import activity_buffer
+from app.core.audit import audit_log
+from app.core.revocation import revocations
+from app.core.health import health_monitor
+from app.core.load_shedding import LoadSheddingMiddleware, limiter
+from app.core.config import (
+    DB_POOL_WARMUP,
+    SHUTDOWN_DRAIN_TIMEOUT,
+    WORKER_READY_DIR,
+    QUERY_PROFILER_ENABLED,
+    LOAD_SHEDDING_ENABLED
+)
+from app.core.security import executor, warmup_executor, warmup_token_codec
+from app.db.database import engine, warmup_pool, create_schema
+from app.db.profiler import QueryProfilerMiddleware, profiler
+from app.repositories.SignupWriter import signup_writer
+from app.utils import background
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if engine.dialect.name == "sqlite":
+        await create_schema()
+    # Warmup: pay connection / hashing / jwt setup costs before traffic arrives
+    try:
+        opened = await warmup_pool(DB_POOL_WARMUP)
+        logger.info("Warmed up %d database connections", opened)
+    except Exception as e:
+        # DB may come up after the app, pool_pre_ping will recover lazily
+        logger.warning("Database warmup failed: %s", e)
+    await warmup_executor()
+    warmup_token_codec()
+    audit_log.start()
+    activity_buffer.start()
+    revocations.start()
+    # first probe before declaring ready, readiness is then served from cache
+    await health_monitor.probe()
+    health_monitor.start()
+    ready_file = os.path.join(WORKER_READY_DIR, str(os.getpid())) if WORKER_READY_DIR else None
+    if ready_file:
+        open(ready_file, "w").close()
+    logger.info("Worker pid=%d ready", os.getpid())
+
+    yield
+
+    if ready_file and os.path.exists(ready_file):
+        os.remove(ready_file)
+    await health_monitor.stop()
+    # Graceful drain: let in-flight emails finish, then release resources
+    await background.drain(SHUTDOWN_DRAIN_TIMEOUT)
+    await signup_writer.stop()
+    await audit_log.stop()
+    await activity_buffer.stop()
+    await revocations.stop()
+    await engine.dispose()
+    executor.shutdown(wait=False)
+
 
 app = FastAPI(title="Coffee Shop API — User Management",
               description="""
@@ -13,12 +75,19 @@ app = FastAPI(title="Coffee Shop API — User Management",
               contact={
                   "name": "Azamjon",
                   "url": "https://github.com/llwtep",
-              }
+              },
+              lifespan=lifespan
               )
 
 app.include_router(router=main_router)
+if QUERY_PROFILER_ENABLED:
+    app.add_middleware(QueryProfilerMiddleware, profiler=profiler)
+# added last = outermost, shed before any other work is done
+if LOAD_SHEDDING_ENABLED:
+    app.add_middleware(LoadSheddingMiddleware, limiter=limiter)
 
 
+# kept for existing checks, load balancers should use /health/ready
 @app.get('/')
 async def get_health():
     return {"OK": 200}
@@ -4,6 +4,8 @@ from sqlalchemy import pool,create_engine
 from alembic import context
 from app.core.config import DATABASE_URL
 from app.db.User import UserModel
+from app.db.UserStats import UserCounterModel, UserSignupDailyModel
+from app.db.AuditEvent import AuditEventModel
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
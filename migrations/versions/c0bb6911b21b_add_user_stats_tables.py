@@ -0,0 +1,51 @@
+"""Add user stats tables
+
+Revision ID: c0bb6911b21b
+Revises: dce103a29d96
+Create Date: 2026-10-19 11:04:17.209815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0bb6911b21b'
+down_revision: Union[str, Sequence[str], None] = 'dce103a29d96'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_counters',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('value', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_table('user_signups_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    # Backfill from existing users
+    op.execute("""
+        INSERT INTO user_counters (name, value)
+        SELECT 'total', count(*) FROM users_table
+        UNION ALL SELECT 'verified', count(*) FILTER (WHERE is_verified) FROM users_table
+        UNION ALL SELECT 'unverified', count(*) FILTER (WHERE NOT is_verified) FROM users_table
+        UNION ALL SELECT 'role:admin', count(*) FILTER (WHERE role = 'ADMIN') FROM users_table
+        UNION ALL SELECT 'role:user', count(*) FILTER (WHERE role = 'USER') FROM users_table
+    """)
+    op.execute("""
+        INSERT INTO user_signups_daily (day, count)
+        SELECT date(created_at), count(*) FROM users_table GROUP BY date(created_at)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_signups_daily')
+    op.drop_table('user_counters')
@@ -0,0 +1,33 @@
+"""Add trigram search indexes
+
+Revision ID: dce103a29d96
+Revises: 9b7cc4d08d11
+Create Date: 2026-10-19 10:12:41.532104
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dce103a29d96'
+down_revision: Union[str, Sequence[str], None] = '9b7cc4d08d11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in ('email', 'name', 'surname'):
+        op.create_index(f'ix_users_table_{column}_trgm', 'users_table', [column],
+                        unique=False, postgresql_using='gin',
+                        postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in ('email', 'name', 'surname'):
+        op.drop_index(f'ix_users_table_{column}_trgm', table_name='users_table',
+                      postgresql_using='gin')
@@ -0,0 +1,133 @@
+"""Production entry point: `python serve.py`
+
+Starts WEB_WORKERS uvicorn processes (one per CPU by default) on uvloop + httptools.
+The Postgres connection budget and argon2 threads are split across workers + 1
+shares: the spare share covers the extra worker of a rolling restart, so the
+fleet stays under `max_connections` during restarts too.
+
+Rolling restart: `kill -HUP <master pid>` replaces workers one at a time, each old
+worker is stopped only after its replacement reported ready.
+SIGTTOU removes a worker; SIGTTIN is refused, the budget is fixed at start
+(restart with a larger WEB_WORKERS instead).
+"""
+import copy
+import importlib.util
+import logging
+import os
+import tempfile
+import time
+
+import uvicorn
+from uvicorn.config import LOGGING_CONFIG
+from uvicorn.supervisors import Multiprocess
+from uvicorn.supervisors.multiprocess import Process
+
+from app.core.config import (
+    HOST,
+    PORT,
+    WEB_WORKERS,
+    DB_MAX_CONNECTIONS,
+    DB_RESERVED_CONNECTIONS,
+    HASH_THREADS_TOTAL,
+    GRACEFUL_SHUTDOWN_TIMEOUT,
+    WORKER_READY_DIR,
+    WORKER_READY_TIMEOUT,
+)
+
+logger = logging.getLogger("serve")
+
+
+def plan_resources(workers: int, max_connections: int, reserved: int, hash_threads: int) -> dict:
+    """Per-worker sizes for DB pool and hashing executor.
+    One spare share: a rolling restart runs workers + 1 processes for a moment"""
+    per_worker = max(1, (max_connections - reserved) // (workers + 1))
+    # Keep a third of each worker's share as overflow for bursts
+    pool_size = max(1, per_worker * 2 // 3)
+    return {
+        "DB_POOL_SIZE": pool_size,
+        "DB_MAX_OVERFLOW": per_worker - pool_size,
+        "HASH_WORKERS": max(1, hash_threads // workers),
+    }
+
+
+class RollingMultiprocess(Multiprocess):
+    """uvicorn supervisor whose SIGHUP restart keeps full capacity: start the new
+    worker, wait for its ready file (written by the app lifespan), then stop the old one"""
+
+    def __init__(self, *args, ready_dir: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ready_dir = ready_dir
+
+    def wait_ready(self, process: Process) -> bool:
+        ready_file = os.path.join(self.ready_dir, str(process.pid))
+        deadline = time.monotonic() + WORKER_READY_TIMEOUT
+        while time.monotonic() < deadline:
+            if os.path.exists(ready_file):
+                return True
+            if not process.process.is_alive():
+                return False
+            time.sleep(0.1)
+        return False
+
+    def restart_all(self) -> None:
+        for idx, old_process in enumerate(self.processes):
+            new_process = Process(self.config, self.target, self.sockets)
+            new_process.start()
+            if not self.wait_ready(new_process):
+                logger.warning("Worker pid=%s did not become ready, keeping pid=%s",
+                               new_process.pid, old_process.pid)
+                new_process.terminate()
+                new_process.join()
+                continue
+            logger.info("Worker pid=%s ready, replacing pid=%s", new_process.pid, old_process.pid)
+            self.processes[idx] = new_process
+            old_process.terminate()
+            old_process.join()
+
+    def handle_ttin(self) -> None:
+        # another worker would take a full share and break the connection budget
+        logger.warning("Received SIGTTIN, ignored: the connection budget is planned for %d workers",
+                       self.processes_num)
+
+
+def build_log_config() -> dict:
+    # uvicorn config + root logger, so app loggers (warmup, readiness) are visible in workers
+    log_config = copy.deepcopy(LOGGING_CONFIG)
+    log_config["loggers"][""] = {"handlers": ["default"], "level": "INFO"}
+    return log_config
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    workers = WEB_WORKERS or cpus
+    resources = plan_resources(workers, DB_MAX_CONNECTIONS, DB_RESERVED_CONNECTIONS,
+                               HASH_THREADS_TOTAL or cpus)
+    ready_dir = WORKER_READY_DIR or tempfile.mkdtemp(prefix="coffee-ready-")
+    # Workers are spawned processes, they read their sizes from the inherited env
+    for key, value in resources.items():
+        os.environ[key] = str(value)
+    os.environ["WORKER_READY_DIR"] = ready_dir
+
+    has_uvloop = importlib.util.find_spec("uvloop") is not None
+    has_httptools = importlib.util.find_spec("httptools") is not None
+    logging.basicConfig(level=logging.INFO)
+    logger.info("Starting %d workers, per worker: %s", workers, resources)
+
+    config = uvicorn.Config(
+        "main:app",
+        host=HOST,
+        port=PORT,
+        workers=workers,
+        loop="uvloop" if has_uvloop else "asyncio",
+        http="httptools" if has_httptools else "h11",
+        proxy_headers=True,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_TIMEOUT,
+        log_config=build_log_config(),
+    )
+    server = uvicorn.Server(config)
+    sock = config.bind_socket()
+    RollingMultiprocess(config, target=server.run, sockets=[sock], ready_dir=ready_dir).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+import os
+
+# app.core.config reads the environment at import: in-memory database, no Redis
+os.environ.setdefault("DATABASE_URL", "memory")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("RATE_STORE", "memory")
+os.environ.setdefault("REVOCATION_SYNC", "memory")
@@ -0,0 +1,102 @@
+import threading
+import time
+
+import fakeredis
+import pytest
+import redis
+
+from app.workers.locks import LeaseLock, _heartbeat, single_flight
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeRedis()
+
+
+def test_second_acquire_fails_while_held(client):
+    first = LeaseLock(client, "job", ttl=10)
+    second = LeaseLock(client, "job", ttl=10)
+    assert first.acquire()
+    assert not second.acquire()
+    assert first.release()
+    assert second.acquire()
+
+
+def test_release_by_non_owner_is_noop(client):
+    owner = LeaseLock(client, "job", ttl=10)
+    other = LeaseLock(client, "job", ttl=10)
+    assert owner.acquire()
+    assert not other.release()
+    assert client.get(owner.key) == owner.token
+
+
+def test_heartbeat_extends_ttl(client):
+    lock = LeaseLock(client, "job", ttl=0.5)
+    assert lock.acquire()
+    stop = threading.Event()
+    renewer = threading.Thread(target=_heartbeat, args=(lock, 0.1, stop), daemon=True)
+    renewer.start()
+    try:
+        time.sleep(1.0)  # twice the TTL
+        assert client.get(lock.key) == lock.token
+        assert client.pttl(lock.key) > 0
+    finally:
+        stop.set()
+        renewer.join()
+
+
+def test_heartbeat_retries_after_redis_error(client, monkeypatch):
+    lock = LeaseLock(client, "job", ttl=0.5)
+    assert lock.acquire()
+    renew = lock.renew
+    failures = iter([redis.ConnectionError("blip")])
+
+    def flaky_renew():
+        error = next(failures, None)
+        if error is not None:
+            raise error
+        return renew()
+
+    monkeypatch.setattr(lock, "renew", flaky_renew)
+    stop = threading.Event()
+    renewer = threading.Thread(target=_heartbeat, args=(lock, 0.1, stop, 0.05), daemon=True)
+    renewer.start()
+    try:
+        time.sleep(1.0)
+        assert renewer.is_alive()
+        assert client.get(lock.key) == lock.token
+    finally:
+        stop.set()
+        renewer.join()
+
+
+def test_single_flight_skips_while_held(client):
+    calls = []
+
+    @single_flight(name="job", ttl=10, client_factory=lambda: client)
+    def task():
+        calls.append(1)
+        return "done"
+
+    holder = LeaseLock(client, "job", ttl=10)
+    assert holder.acquire()
+    assert task() is None
+    assert calls == []
+
+    holder.release()
+    assert task() == "done"
+    assert calls == [1]
+    assert client.get(holder.key) is None
+
+
+def test_single_flight_release_error_keeps_result(client, monkeypatch):
+    def failing_release(self):
+        raise redis.ConnectionError("down")
+
+    monkeypatch.setattr(LeaseLock, "release", failing_release)
+
+    @single_flight(name="job", ttl=10, client_factory=lambda: client)
+    def task():
+        return "done"
+
+    assert task() == "done"
@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pytest
+from fakeredis import FakeServer, aioredis
+
+from app.core import revocation
+from app.core.revocation import RevocationList
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+def make_list(server, sweep_interval=0.05):
+    return RevocationList(aioredis.FakeRedis(server=server), sweep_interval=sweep_interval)
+
+
+async def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_revocations_reach_other_instances(server):
+    first, second = make_list(server), make_list(server)
+    first.start()
+    second.start()
+    try:
+        await wait_for(lambda: second._task is not None)
+        await asyncio.sleep(0.1)  # both subscribed
+        await first.revoke("jti-1", time.time() + 60)
+        await first.revoke_user("user-1")
+        await wait_for(lambda: second.is_revoked({"jti": "jti-1"}))
+        assert second.is_revoked({"sub": "user-1", "iat": time.time() - 1})
+    finally:
+        await first.stop()
+        await second.stop()
+
+
+@pytest.mark.asyncio
+async def test_load_restores_snapshot(server):
+    writer = make_list(server)
+    await writer.revoke("jti-1", time.time() + 60)
+    await writer.revoke("gone", time.time() + 0.05)
+    cutoff = time.time() - 10
+    await writer.revoke_user("user-1", cutoff=cutoff)
+    await asyncio.sleep(0.1)
+
+    late = make_list(server)
+    assert await late.load() == 2
+    assert late.is_revoked({"jti": "jti-1"})
+    assert not late.is_revoked({"jti": "gone"})
+    assert late.is_revoked({"sub": "user-1", "iat": cutoff - 1})
+    assert not late.is_revoked({"sub": "user-1", "iat": cutoff + 1})
+
+
+@pytest.mark.asyncio
+async def test_sweep_drops_expired_entries(monkeypatch):
+    monkeypatch.setattr(revocation, "MAX_TOKEN_LIFETIME", 0.05)
+    revocations = RevocationList(None, sweep_interval=1)
+    await revocations.revoke("short", time.time() + 0.05)
+    await revocations.revoke("long", time.time() + 60)
+    await revocations.revoke_user("user-1")
+    assert revocations.snapshot()["tokens"] == 2
+
+    await asyncio.sleep(0.1)
+    assert revocations.sweep() == 2
+    assert revocations.snapshot() == {"tokens": 1, "users": 0, "replicated": False}
+    assert [key for _, _, key in revocations._expiry] == ["long"]
+    assert revocations.is_revoked({"jti": "long"})
+
+
+@pytest.mark.asyncio
+async def test_user_cutoff_uses_iat():
+    revocations = RevocationList(None, sweep_interval=1)
+    cutoff = time.time()
+    await revocations.revoke_user("user-1", cutoff=cutoff)
+    assert revocations.is_revoked({"sub": "user-1", "iat": cutoff - 1})
+    assert revocations.is_revoked({"sub": "user-1", "iat": cutoff})
+    assert revocations.is_revoked({"sub": "user-1"})  # issued before tokens had iat
+    assert not revocations.is_revoked({"sub": "user-1", "iat": cutoff + 0.001})
+    assert not revocations.is_revoked({"sub": "user-2", "iat": cutoff - 1})
+
+    # a later revoke-all moves the cutoff forward, never back
+    await revocations.revoke_user("user-1", cutoff=cutoff + 10)
+    await revocations.revoke_user("user-1", cutoff=cutoff + 5)
+    assert revocations.is_revoked({"sub": "user-1", "iat": cutoff + 7})